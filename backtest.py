@@ -0,0 +1,191 @@
+# Backtesting dan hyperparameter search untuk model penjualan mingguan.
+#
+#   python backtest.py [--min-train 8] [--horizon 1] [--workers N]
+#
+# Setiap kandidat (LinearRegression, Ridge dengan grid alpha, ARIMA(5,1,0))
+# dievaluasi dengan rolling-origin split: latih pada minggu [0, t), uji pada
+# minggu [t, t + horizon), lalu geser t satu minggu. Fold dijalankan paralel
+# di process pool dan hasilnya di-cache di disk (kunci: hash data + config),
+# sehingga fold yang sudah pernah dihitung dilewati.
+import argparse
+import hashlib
+import json
+import logging
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join('.cache', 'backtest')
+METRICS_PATH = 'backtest_metrics.csv'
+METRICS_FILE = 'metrics.csv'
+
+logger = logging.getLogger(__name__)
+
+# Kandidat model: nama -> grid parameter
+CANDIDATES = {
+    'LinearRegression': {},
+    'Ridge': {'alpha': [0.1, 1.0, 10.0, 100.0]},
+    'ARIMA': {'order': [(5, 1, 0)]},
+}
+
+
+def parameter_grid(grid):
+    configs = [{}]
+    for name, values in grid.items():
+        configs = [{**config, name: value} for config in configs for value in values]
+    return configs
+
+
+def candidate_configs(candidates=CANDIDATES):
+    return [(model, params) for model, grid in candidates.items() for params in parameter_grid(grid)]
+
+
+def rolling_origin_splits(n_weeks, min_train, horizon=1):
+    # (akhir train, akhir test) untuk setiap origin
+    return [(end, min(end + horizon, n_weeks)) for end in range(min_train, n_weeks)]
+
+
+def fit_predict(model, params, train, n_test):
+    if model == 'ARIMA':
+        from statsmodels.tsa.arima.model import ARIMA
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fitted = ARIMA(train, order=params['order']).fit()
+        return np.asarray(fitted.forecast(n_test))
+
+    from sklearn.linear_model import LinearRegression, Ridge
+
+    estimator = LinearRegression() if model == 'LinearRegression' else Ridge(**params)
+    X_train = np.arange(len(train)).reshape(-1, 1)
+    X_test = np.arange(len(train), len(train) + n_test).reshape(-1, 1)
+    return estimator.fit(X_train, train).predict(X_test)
+
+
+def digest(*parts):
+    sha256 = hashlib.sha256()
+    for part in parts:
+        sha256.update(part if isinstance(part, bytes) else json.dumps(part, sort_keys=True).encode())
+    return sha256.hexdigest()[:16]
+
+
+def series_hash(weekly):
+    return digest(weekly.to_numpy(dtype='float64').tobytes(), [str(date) for date in weekly.index])
+
+
+def fold_path(data_hash, model, params, split):
+    return os.path.join(CACHE_DIR, data_hash, f'{digest(model, params, split)}.json')
+
+
+def metrics_path(data_hash):
+    # Ringkasan metrik disimpan di samping fold-nya, jadi selalu sesuai dengan data yang diuji
+    return os.path.join(CACHE_DIR, data_hash, METRICS_FILE)
+
+
+def run_fold(task):
+    path, model, params, values, (train_end, test_end) = task
+    train, test = values[:train_end], values[train_end:test_end]
+    try:
+        predictions = fit_predict(model, params, train, len(test)).tolist()
+    except Exception as error:  # ARIMA bisa gagal konvergen pada seri pendek
+        # Fold yang gagal tidak di-cache (dicoba lagi pada run berikutnya) dan
+        # tidak dihitung di ringkasan
+        logger.warning('%s %s fold %d gagal: %s', model, params, train_end, error)
+        return {'model': model, 'params': params, 'train_end': train_end, 'actual': [], 'predicted': [],
+                'failed': True}
+
+    result = {'model': model, 'params': params, 'train_end': train_end,
+              'actual': test.tolist(), 'predicted': predictions}
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w') as file:
+        json.dump(result, file)
+    os.replace(path + '.tmp', path)
+    return result
+
+
+def run_backtest(weekly, min_train=8, horizon=1, workers=None, candidates=CANDIDATES):
+    values = weekly.to_numpy(dtype='float64')
+    data_hash = series_hash(weekly)
+    splits = rolling_origin_splits(len(values), min_train, horizon)
+
+    results, tasks = [], []
+    for model, params in candidate_configs(candidates):
+        for split in splits:
+            path = fold_path(data_hash, model, params, list(split))
+            if os.path.exists(path):
+                with open(path) as file:
+                    results.append(json.load(file))
+            else:
+                tasks.append((path, model, params, values, split))
+
+    logger.info('%d fold dari cache, %d fold dihitung', len(results), len(tasks))
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            results.extend(pool.map(run_fold, tasks))
+    metrics = summarize(results)
+    path = metrics_path(data_hash)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    metrics.to_csv(path + '.tmp', index=False)
+    os.replace(path + '.tmp', path)
+    return metrics
+
+
+def load_metrics(weekly):
+    # Metrik untuk seri mingguan ini bila sudah pernah di-backtest; bila belum,
+    # METRICS_PATH (hasil run terakhir yang disimpan) dengan tanda bahwa
+    # metrik itu bisa berasal dari data lain
+    data_hash = series_hash(weekly)
+    path = metrics_path(data_hash)
+    fresh = os.path.exists(path)
+    if not fresh:
+        path = METRICS_PATH
+    info = {'path': path, 'data_hash': data_hash, 'fresh': fresh, 'modified': os.path.getmtime(path)}
+    return pd.read_csv(path).fillna({'Params': ''}), info
+
+
+def summarize(results):
+    rows = []
+    frame = pd.DataFrame(results)
+    if 'failed' in frame:
+        frame = frame[frame['failed'] != True].drop(columns='failed')  # noqa: E712
+    frame['config'] = frame['params'].apply(lambda params: json.dumps(params, sort_keys=True))
+    for (model, config), folds in frame.groupby(['model', 'config'], sort=False):
+        actual = np.concatenate([np.asarray(values, dtype='float64') for values in folds['actual']])
+        predicted = np.concatenate([np.asarray(values, dtype='float64') for values in folds['predicted']])
+        errors = actual - predicted
+        mse = float(np.mean(errors ** 2)) if len(errors) else np.nan
+        rows.append({
+            'Model': model,
+            'Params': ', '.join(f'{name}={tuple(value) if isinstance(value, list) else value}'
+                                for name, value in json.loads(config).items()),
+            'Folds': len(folds),
+            'MAE': float(np.mean(np.abs(errors))) if len(errors) else np.nan,
+            'MSE': mse,
+            'RMSE': float(np.sqrt(mse)),
+        })
+    return pd.DataFrame(rows).sort_values('RMSE', ignore_index=True)
+
+
+def main():
+    from data_loader import read_csv
+    from forecasting import daily_sales, weekly_sales
+
+    parser = argparse.ArgumentParser(description='Rolling-origin backtest untuk model penjualan mingguan')
+    parser.add_argument('--min-train', type=int, default=8, help='jumlah minggu minimum untuk data train')
+    parser.add_argument('--horizon', type=int, default=1, help='jumlah minggu yang diuji per fold')
+    parser.add_argument('--workers', type=int, default=None, help='jumlah proses (default: semua core)')
+    parser.add_argument('--output', default=METRICS_PATH)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    weekly = weekly_sales(daily_sales(read_csv(columns=['Date', 'Total', 'Quantity'])))
+    metrics = run_backtest(weekly, args.min_train, args.horizon, args.workers)
+    metrics.to_csv(args.output, index=False)
+    print(metrics.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Benchmark batch forecasting: satu solve least squares untuk semua grup vs
+# loop LinearRegression().fit per grup.
+#
+#   python benchmarks/bench_batch_forecast.py [jumlah_grup] [jumlah_minggu]
+import os
+import sys
+import time
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from forecasting import fit_batch, predict_batch  # noqa: E402
+
+WEEKS_AHEAD = 12
+
+
+def loop_forecast(Y):
+    X = np.arange(Y.shape[1]).reshape(-1, 1)
+    future_weeks = np.arange(Y.shape[1], Y.shape[1] + WEEKS_AHEAD).reshape(-1, 1)
+    return np.column_stack([LinearRegression().fit(X, y).predict(future_weeks) for y in Y])
+
+
+def main():
+    groups = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    weeks = int(sys.argv[2]) if len(sys.argv) > 2 else 156
+
+    rng = np.random.default_rng(0)
+    trend = rng.normal(20, 10, (groups, 1)) * np.arange(weeks)
+    Y = rng.gamma(2.0, 2000.0, (groups, 1)) + trend + rng.normal(0, 500, (groups, weeks))
+
+    start = time.perf_counter()
+    expected = loop_forecast(Y)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = predict_batch(fit_batch(Y), weeks, WEEKS_AHEAD)
+    batch_seconds = time.perf_counter() - start
+
+    assert np.allclose(result, expected)
+    print(f'{groups:,} grup x {weeks} minggu, horizon {WEEKS_AHEAD} minggu')
+    print(f'loop LinearRegression: {loop_seconds * 1000:10.1f} ms')
+    print(f'batch least squares:   {batch_seconds * 1000:10.1f} ms  ({loop_seconds / batch_seconds:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
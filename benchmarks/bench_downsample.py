@@ -0,0 +1,72 @@
+# Benchmark downsampling grafik garis: ukuran payload (Arrow IPC, format yang
+# dikirim st.line_chart ke browser) dan waktu render PNG matplotlib untuk seri
+# penuh vs hasil downsample (minmax dan LTTB) pada anggaran titik selebar grafik.
+#
+#   python benchmarks/bench_downsample.py [jumlah_titik ...]
+#
+# Seri sintetis berupa random walk per jam, seperti histori penjualan harian
+# bertahun-tahun dari banyak toko yang digabung.
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downsample import downsample, figure_width_px, point_budget  # noqa: E402
+from rendering import new_figure  # noqa: E402
+
+FIGSIZE = (12, 6)
+DPI = 100
+
+
+def synthetic_series(points, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2000-01-01', periods=points, freq='h', name='Date')
+    return pd.Series(1000 + np.cumsum(rng.normal(0, 25, points)), index=index, name='Total')
+
+
+def payload_bytes(series):
+    table = pa.Table.from_pandas(series.reset_index(), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def render_seconds(series):
+    start = time.perf_counter()
+    fig = new_figure(FIGSIZE)
+    ax = fig.subplots()
+    ax.plot(series.index, series.to_numpy())
+    fig.savefig(io.BytesIO(), format='png', dpi=DPI)
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    width = figure_width_px(new_figure(FIGSIZE), DPI)
+    render_seconds(synthetic_series(10))  # pemanasan: import backend dan font cache
+    print(f'grafik {width:.0f} px, anggaran minmax {point_budget(width)} titik, lttb {point_budget(width, "lttb")} titik')
+    print(f'{"titik":>10} {"metode":<7} {"hasil":>7} {"payload KB":>11} {"downsample ms":>14} '
+          f'{"render ms":>10} {"puncak/lembah":>14}')
+    for size in sizes:
+        series = synthetic_series(size)
+        print(f'{size:>10,} {"penuh":<7} {size:>7,} {payload_bytes(series) / 1024:>11,.0f} {0:>14.1f} '
+              f'{render_seconds(series) * 1000:>10.0f} {"-":>14}')
+        for method in ('minmax', 'lttb'):
+            start = time.perf_counter()
+            reduced = downsample(series, point_budget(width, method), method=method)
+            elapsed = time.perf_counter() - start
+            extremes = reduced.max() == series.max() and reduced.min() == series.min()
+            print(f'{size:>10,} {method:<7} {len(reduced):>7,} {payload_bytes(reduced) / 1024:>11,.0f} '
+                  f'{elapsed * 1000:>14.1f} {render_seconds(reduced) * 1000:>10.0f} '
+                  f'{"tetap" if extremes else "bergeser":>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# Microbenchmark filter Dashboard: FilterIndex vs boolean mask penuh.
+#
+#   python benchmarks/bench_filter.py [jumlah_baris]
+#
+# Data sintetis diurutkan per tanggal (3 tahun), dengan Branch/City kategorikal
+# seperti pada supermarket_sales.csv. Target: < 10 ms pada 10 juta baris.
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from filter_index import FilterIndex  # noqa: E402
+
+BRANCH_CITY = [('A', 'Yangon'), ('B', 'Mandalay'), ('C', 'Naypyitaw')]
+
+
+def synthetic_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = np.sort(rng.integers(0, 3 * 365, rows))
+    store = rng.integers(0, len(BRANCH_CITY), rows)
+    return pd.DataFrame({
+        'Date': pd.Timestamp('2019-01-01') + pd.to_timedelta(dates, unit='D'),
+        'Branch': pd.Categorical.from_codes(store, [branch for branch, _ in BRANCH_CITY]),
+        'City': pd.Categorical.from_codes(store, [city for _, city in BRANCH_CITY]),
+        'Total': rng.gamma(2.0, 150.0, rows),
+    })
+
+
+def mask_filter(data, start, end, branches, cities):
+    return data[
+        (data['Date'] >= pd.to_datetime(start)) &
+        (data['Date'] <= pd.to_datetime(end)) &
+        (data['Branch'].isin(branches)) &
+        (data['City'].isin(cities))
+    ]
+
+
+def best_of(function, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    data = synthetic_frame(rows)
+
+    start = time.perf_counter()
+    index = FilterIndex(data)
+    print(f'{rows:,} baris, membangun indeks: {time.perf_counter() - start:.2f} s')
+
+    first = pd.Timestamp('2019-01-01')
+    windows = {
+        'narrow (7 hari)': (first + pd.Timedelta(days=400), first + pd.Timedelta(days=406)),
+        'wide (semua)': (first, first + pd.Timedelta(days=3 * 365)),
+    }
+    selections = {
+        'semua cabang': (['A', 'B', 'C'], ['Yangon', 'Mandalay', 'Naypyitaw']),
+        'satu cabang': (['A'], ['Yangon', 'Mandalay', 'Naypyitaw']),
+    }
+
+    # "select" = rentang tanggal + bitmap sampai posisi baris; "frame" = termasuk
+    # menyalin baris yang lolos menjadi DataFrame (dibatasi bandwidth memori)
+    print(f'{"window":<18} {"selection":<14} {"rows":>10} {"mask (ms)":>10} {"select (ms)":>12} {"frame (ms)":>11}')
+    for window_name, (start_date, end_date) in windows.items():
+        for selection_name, (branches, cities) in selections.items():
+            filters = {'Branch': branches, 'City': cities}
+            mask_ms, expected = best_of(lambda: mask_filter(data, start_date, end_date, branches, cities))
+            select_ms, _ = best_of(lambda: index.positions(start_date, end_date, filters))
+            frame_ms, result = best_of(lambda: index.filter(start_date, end_date, filters))
+            assert len(result) == len(expected) and result['Total'].sum() == expected['Total'].sum()
+            print(f'{window_name:<18} {selection_name:<14} {len(result):>10,} {mask_ms:>10.2f} '
+                  f'{select_ms:>12.2f} {frame_ms:>11.2f}')
+
+
+if __name__ == '__main__':
+    main()
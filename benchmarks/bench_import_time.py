@@ -0,0 +1,94 @@
+# Benchmark waktu import (python -X importtime): import modul shell app.py
+# (dibaca dari import top-level app.py) lalu import modul tiap halaman di
+# views/, masing-masing di proses baru. Gagal (exit 1) bila ada library berat
+# yang terimpor di tempat yang tidak seharusnya atau waktu melewati budget.
+#
+#   python benchmarks/bench_import_time.py [--top 10] [--budget-scale 1.0]
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from views import PAGES  # noqa: E402
+
+# Library yang tidak boleh terimpor sebelum dibutuhkan (seaborn sendiri ikut
+# mengimpor scipy dan statsmodels bila terpasang)
+FORBIDDEN = {
+    'app': ['matplotlib', 'seaborn', 'sklearn', 'statsmodels', 'scipy'],
+    'views.sales_analysis': ['sklearn'],
+    'views.dashboard': ['sklearn'],
+    'views.forecasting': ['matplotlib', 'seaborn', 'sklearn', 'statsmodels', 'scipy'],
+}
+
+# Budget waktu import kumulatif (ms); import halaman diukur setelah shell diimpor
+BUDGET_MS = {
+    'app': 1500,
+    'views.sales_analysis': 2500,
+    'views.dashboard': 2500,
+    'views.forecasting': 200,
+}
+
+
+def shell_imports(path=os.path.join(ROOT, 'app.py')):
+    # Modul yang diimpor di top-level app.py
+    modules = []
+    for node in ast.parse(open(path).read()).body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules.append(node.module)
+    return modules
+
+
+def importtime(setup, target):
+    # Menjalankan `import setup...; import target` dengan -X importtime;
+    # mengembalikan {modul: (self_us, cumulative_us, level)} untuk import target saja
+    code = ''.join(f'import {module}\n' for module in setup) + 'import sys\nprint("--target--", file=sys.stderr)\n'
+    code += ''.join(f'import {module}\n' for module in target)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    timings = {}
+    for line in result.stderr.split('--target--', 1)[1].splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us), (len(name) - len(name.lstrip())) // 2)
+    return timings
+
+
+def report(name, timings, top, budget_scale):
+    total_ms = sum(cumulative for _, cumulative, level in timings.values() if level == 0) / 1000
+    roots = {module.split('.')[0] for module in timings}
+    leaks = [module for module in FORBIDDEN[name] if module in roots]
+    budget = BUDGET_MS[name] * budget_scale
+    print(f'{name}: {total_ms:.0f} ms (budget {budget:.0f} ms), {len(timings)} modul')
+    for module, (self_us, cumulative_us, _) in sorted(timings.items(), key=lambda item: -item[1][0])[:top]:
+        print(f'    {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms kumulatif  {module}')
+    problems = [f'{name} mengimpor {module}' for module in leaks]
+    if total_ms > budget:
+        problems.append(f'{name} melewati budget ({total_ms:.0f} > {budget:.0f} ms)')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--budget-scale', type=float, default=1.0)
+    args = parser.parse_args()
+
+    shell = shell_imports()
+    problems = report('app', importtime([], shell), args.top, args.budget_scale)
+    for module in PAGES.values():
+        problems += report(module, importtime(shell, [module]), args.top, args.budget_scale)
+
+    for problem in problems:
+        print('GAGAL:', problem)
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == '__main__':
+    main()
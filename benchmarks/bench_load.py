@@ -0,0 +1,62 @@
+# Benchmark waktu muat (cold dan warm) serta peak RSS: CSV vs snapshot Parquet.
+#
+#   python benchmarks/bench_load.py [path/ke/data.csv]
+#
+# Setiap kombinasi dijalankan di proses baru: pembacaan pertama dihitung
+# sebagai "cold" (proses baru, belum ada cache pandas/pyarrow), pembacaan
+# kedua di proses yang sama sebagai "warm".
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_loader import DATA_URL, PAGE_COLUMNS, convert_snapshot  # noqa: E402
+
+CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+from data_loader import read_csv
+from snapshot import read_snapshot, snapshot_path
+
+source, path, columns = {source!r}, {path!r}, {columns!r}
+
+def read():
+    if source == 'csv':
+        return read_csv(path, columns)
+    return read_snapshot(snapshot_path(path), columns)
+
+base_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+timings = []
+for _ in range(2):
+    start = time.perf_counter()
+    read()
+    timings.append(time.perf_counter() - start)
+peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'cold': timings[0], 'warm': timings[1], 'peak_rss_mb': peak_rss_kb / 1024,
+                  'load_rss_mb': (peak_rss_kb - base_rss_kb) / 1024}}))
+"""
+
+
+def run(source, path, columns):
+    code = CHILD.format(root=ROOT, source=source, path=path, columns=columns)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    path = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, DATA_URL))
+    convert_snapshot(path)
+
+    print(f'{"page":<15} {"source":<8} {"cold (s)":>10} {"warm (s)":>10} {"peak RSS (MB)":>14} {"load RSS (MB)":>14}')
+    for page, columns in [('Sales Analysis', None), *PAGE_COLUMNS.items()]:
+        for source in ['csv', 'parquet']:
+            result = run(source, path, columns)
+            print(f'{page:<15} {source:<8} {result["cold"]:>10.4f} {result["warm"]:>10.4f} '
+                  f'{result["peak_rss_mb"]:>14.1f} {result["load_rss_mb"]:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+# Benchmark skala untuk seluruh pipeline app: untuk setiap ukuran data sintetis
+# (benchmarks/synthetic_sales.py) semua tahap dijalankan berurutan di proses
+# baru, dan waktu wall serta peak RSS tiap tahap dicatat:
+#
+#   load, clean                    membaca dan membersihkan CSV
+#   rollup, dashboard_index,       agregat Dashboard, filter sidebar, dan
+#   dashboard_filter, dashboard_groupby   groupby untuk grafik-grafiknya
+#   weekly_resample, predict, intervals   seri mingguan, model pickle, P10-P90
+#   profile, plot.<grafik>         profil dan grafik halaman Sales Analysis
+#
+# Hasil ditambahkan ke file JSON lines (satu baris per tahap, dengan commit
+# git), dan dibandingkan dengan run terakhir dari commit lain di file yang sama.
+#
+#   python benchmarks/bench_scale.py [--rows 10000 100000 1000000] [--skip plot.]
+#                                    [--output benchmarks/scale_results.jsonl] [--compare <commit>]
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_PATH = os.path.join(ROOT, 'benchmarks', 'scale_results.jsonl')
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+FORECAST_WEEKS = 12
+
+
+def _read_status(field):
+    with open('/proc/self/status') as file:
+        for line in file:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) * 1024
+    raise OSError(field)
+
+
+def reset_peak_rss():
+    # Linux: menulis 5 ke clear_refs me-reset VmHWM (peak RSS) proses ini;
+    # selain itu peak bersifat kumulatif sejak proses dimulai
+    try:
+        with open('/proc/self/clear_refs', 'w') as file:
+            file.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_bytes():
+    try:
+        return _read_status('VmHWM')
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if platform.system() == 'Darwin' else peak * 1024
+
+
+def stages():
+    # Nama tahap -> fungsi(state); import di sini supaya proses induk tetap ringan
+    import pandas as pd
+
+    from data_loader import SCHEMA, clean_data
+    from filter_index import FilterIndex
+    from forecasting import bootstrap_intervals, daily_sales, forecast, weekly_sales
+    from model_registry import DEFAULT_MODEL, MODEL_VERSIONS, load_artifact
+    from profiling import build_profile
+    from rollup import build_rollup, rating_histogram, sales_by
+    from sales_charts import CHARTS, render_chart
+
+    def dashboard_filter(state):
+        # Rentang tanggal separuh tengah, dua dari tiga cabang
+        index = state['filter_index']
+        first, last = (pd.Timestamp(date) for date in index.date_range())
+        quarter = (last - first) / 4
+        branches = index.categories('Branch')[:2]
+        return index.filter((first + quarter).date(), (last - quarter).date(), {'Branch': branches})
+
+    def dashboard_groupby(state):
+        filtered = state['filtered']
+        return [sales_by(filtered, 'Date'), sales_by(filtered.assign(Month=filtered['Date'].dt.month), 'Month'),
+                sales_by(filtered, 'Branch'), sales_by(filtered, 'Product line'), rating_histogram(filtered)]
+
+    def predict(state):
+        state['model'] = load_artifact(MODEL_VERSIONS[DEFAULT_MODEL])
+        return forecast(state['model'], state['weekly'], FORECAST_WEEKS)
+
+    return [
+        ('load', 'raw', lambda state: pd.read_csv(state['path'], dtype=SCHEMA)),
+        ('clean', 'data', lambda state: clean_data(state.pop('raw'))),
+        ('rollup', 'rollup', lambda state: build_rollup(state['data'])),
+        ('dashboard_index', 'filter_index', lambda state: FilterIndex(state['rollup'])),
+        ('dashboard_filter', 'filtered', dashboard_filter),
+        ('dashboard_groupby', None, dashboard_groupby),
+        ('weekly_resample', 'weekly', lambda state: weekly_sales(daily_sales(state['data']))),
+        ('predict', None, predict),
+        ('intervals', None, lambda state: bootstrap_intervals(state['model'], state['weekly'], FORECAST_WEEKS)),
+        ('profile', 'profile', lambda state: build_profile(state['data'])),
+        *[(f'plot.{name}', None, lambda state, name=name: render_chart(name, state['data'], state['profile']))
+          for name in CHARTS],
+    ]
+
+
+def run_child(path, skip):
+    # Dijalankan di proses anak; mencetak satu baris JSON per tahap
+    state = {'path': path}
+    exact_peak = reset_peak_rss()
+    for name, key, function in stages():
+        if any(name.startswith(prefix) for prefix in skip):
+            continue
+        reset_peak_rss()
+        rss = _read_status('VmRSS') if exact_peak else peak_rss_bytes()
+        start = time.perf_counter()
+        result = function(state)
+        seconds = time.perf_counter() - start
+        peak = peak_rss_bytes()
+        if key is not None:
+            state[key] = result
+        print(json.dumps({'stage': name, 'seconds': seconds, 'peak_rss_mb': peak / 1024 ** 2,
+                          'peak_delta_mb': (peak - rss) / 1024 ** 2, 'exact_peak': exact_peak}), flush=True)
+
+
+def git_commit():
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True)
+
+    commit = git('rev-parse', '--short', 'HEAD').stdout.strip() or 'unknown'
+    dirty = git('status', '--porcelain', '--untracked-files=no').stdout.strip()
+    return commit + ('-dirty' if dirty else '')
+
+
+def load_results(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def baseline(records, commit):
+    # Record terakhir per (rows, stage) dari `commit`, atau dari commit lain
+    # yang paling baru bila None
+    if commit is None:
+        others = [record['commit'] for record in records if record['commit'] != git_commit()]
+        if not others:
+            return None, {}
+        commit = others[-1]
+    return commit, {(record['rows'], record['stage']): record for record in records if record['commit'] == commit}
+
+
+def main():
+    from synthetic_sales import ensure_dataset
+
+    parser = argparse.ArgumentParser(description='Benchmark skala pipeline app dengan data sintetis')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--skip', nargs='*', default=[], help='awalan nama tahap yang dilewati, mis. plot.')
+    parser.add_argument('--output', default=RESULTS_PATH)
+    parser.add_argument('--compare', help='commit pembanding (default: commit lain terakhir di file hasil)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.skip)
+        return
+
+    commit = git_commit()
+    base_commit, base = baseline(load_results(args.output), args.compare)
+    run = {'commit': commit, 'timestamp': time.time(), 'python': platform.python_version(),
+           'machine': platform.machine(), 'cpus': os.cpu_count()}
+    print(f'commit {commit}' + (f', dibandingkan dengan {base_commit}' if base_commit else ''))
+
+    for rows in args.rows:
+        start = time.perf_counter()
+        path = ensure_dataset(rows)
+        print(f'\n{rows:,} baris ({os.path.getsize(path) / 1024 ** 2:,.1f} MB CSV, '
+              f'disiapkan dalam {time.perf_counter() - start:.1f} s)')
+        print(f'{"tahap":<34} {"wall (s)":>10} {"peak RSS (MB)":>14} {"Δ peak (MB)":>12} {"vs base":>8}')
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--child', path, '--skip', *args.skip],
+                                 cwd=ROOT, stdout=subprocess.PIPE, text=True)
+        with open(args.output, 'a') as results:
+            for line in child.stdout:
+                record = {**run, 'rows': rows, **json.loads(line)}
+                results.write(json.dumps(record) + '\n')
+                previous = base.get((rows, record['stage']))
+                change = f'{record["seconds"] / previous["seconds"] - 1:+.0%}' if previous and previous['seconds'] else '-'
+                print(f'{record["stage"]:<34} {record["seconds"]:>10.3f} {record["peak_rss_mb"]:>14.1f} '
+                      f'{record["peak_delta_mb"]:>12.1f} {change:>8}')
+        if child.wait():
+            sys.exit(f'tahap gagal pada {rows:,} baris (exit {child.returncode})')
+
+
+if __name__ == '__main__':
+    main()
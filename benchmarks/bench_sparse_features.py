@@ -0,0 +1,94 @@
+# Benchmark matriks fitur: one-hot padat lewat pd.get_dummies (seperti bagian
+# Feature Preprocessing) vs CSR dari features.SparseFeatures, dengan fitur yang
+# sama (6 kolom kategorikal, Month/Day/Weekday one-hot, Quantity, tren minggu).
+# Untuk tiap ukuran dilaporkan waktu build, ukuran matriks, peak RSS, dan
+# waktu fit Ridge. Kedua jalur memakai solver yang sama (sparse_cg dengan tol
+# RIDGE_TOL), jadi prediksinya hanya berbeda sebesar toleransi iteratif itu
+# (sekitar 1e-6 pada Total; dengan solver default, dense memakai cholesky dan
+# sparse memakai sparse_cg tol 1e-4, selisihnya bisa sampai ~0.4).
+#
+#   python benchmarks/bench_sparse_features.py [jumlah_baris ...]
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_scale import _read_status, peak_rss_bytes, reset_peak_rss  # noqa: E402
+from synthetic_sales import InvoiceModel  # noqa: E402
+
+from data_loader import CATEGORICAL_COLUMNS, SCHEMA, clean_data  # noqa: E402
+from features import CALENDAR_FIELDS, SparseFeatures  # noqa: E402
+
+NUMERIC = ['Quantity']
+RIDGE_ALPHA = 1.0
+RIDGE_SOLVER = 'sparse_cg'
+RIDGE_TOL = 1e-8
+
+
+def dense_dummies(data):
+    # Jalur lama: kolom kalender ditambahkan ke frame, lalu semua di-one-hot padat
+    dates = data['Date'].dt
+    calendar = {field: pd.Categorical(to_code(dates), categories=range(size))
+                for field, (to_code, size) in CALENDAR_FIELDS.items()}
+    frame = pd.get_dummies(data[CATEGORICAL_COLUMNS].assign(**calendar), dtype='float64')
+    frame[NUMERIC] = data[NUMERIC].astype('float64')
+    frame['trend_weeks'] = (data['Date'] - data['Date'].min()).dt.days / 7
+    return frame.to_numpy()
+
+
+def sparse_design(data):
+    return SparseFeatures(numeric=NUMERIC).fit_transform(data)
+
+
+def matrix_bytes(matrix):
+    if isinstance(matrix, np.ndarray):
+        return matrix.nbytes
+    return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+
+
+def measure(function, *args):
+    # (hasil, detik, kenaikan peak RSS dalam MB selama pemanggilan)
+    reset_peak_rss()
+    rss = _read_status('VmRSS')
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    return result, seconds, (peak_rss_bytes() - rss) / 1024 ** 2
+
+
+def fit_ridge(X, y):
+    from sklearn.linear_model import Ridge
+
+    return Ridge(alpha=RIDGE_ALPHA, solver=RIDGE_SOLVER, tol=RIDGE_TOL).fit(X, y)
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    model = InvoiceModel.from_csv()
+    fit_ridge(np.eye(3), np.ones(3))  # pemanasan: import sklearn
+
+    print(f'{"baris":>10} {"jalur":<7} {"kolom":>6} {"build s":>8} {"matriks MB":>11} {"peak build MB":>14} '
+          f'{"fit s":>7} {"peak fit MB":>12}')
+    for rows in sizes:
+        data = clean_data(model.chunk(rows, 0, np.random.default_rng(rows)).astype(SCHEMA))
+        y = data['Total'].to_numpy()
+        predictions = {}
+        for name, build in (('dense', dense_dummies), ('sparse', sparse_design)):
+            X, build_seconds, build_peak = measure(build, data)
+            fitted, fit_seconds, fit_peak = measure(fit_ridge, X, y)
+            predictions[name] = fitted.predict(X[:1000])
+            print(f'{rows:>10,} {name:<7} {X.shape[1]:>6} {build_seconds:>8.3f} {matrix_bytes(X) / 1024 ** 2:>11.1f} '
+                  f'{build_peak:>14.1f} {fit_seconds:>7.3f} {fit_peak:>12.1f}')
+            del X, fitted
+        difference = np.abs(predictions['dense'] - predictions['sparse']).max()
+        # Solver sama di kedua jalur; selisih hanya dari toleransi iteratif RIDGE_TOL
+        print(f'{"":>10} selisih prediksi maksimum dense vs sparse: {difference:.2e}')
+
+
+if __name__ == '__main__':
+    main()
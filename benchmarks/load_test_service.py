@@ -0,0 +1,93 @@
+# Load test lokal untuk service.py: menjalankan server uvicorn di subprocess
+# (kecuali --url diberikan), lalu N koneksi keep-alive mengirim GET /forecast
+# berulang selama beberapa detik dan melaporkan request/detik serta latensi.
+#
+#   python benchmarks/load_test_service.py [--connections 32] [--seconds 10] [--url http://127.0.0.1:8000]
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORT = 8765
+HORIZONS = [4, 8, 12, 26, 52]
+
+
+async def worker(host, port, deadline, latencies, errors, index):
+    reader, writer = await asyncio.open_connection(host, port)
+    request_number = index
+    try:
+        while time.perf_counter() < deadline:
+            weeks = HORIZONS[request_number % len(HORIZONS)]
+            request_number += 1
+            start = time.perf_counter()
+            writer.write(f'GET /forecast?weeks={weeks} HTTP/1.1\r\nHost: {host}\r\n\r\n'.encode())
+            status = await reader.readline()
+            length = 0
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                name, _, value = line.decode().partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if b' 200 ' not in status:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(url, connections, seconds):
+    parts = urlsplit(url)
+    latencies, errors = [], []
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(parts.hostname, parts.port, deadline, latencies, errors, i)
+                           for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies = np.array(latencies) * 1000
+    print(f'{len(latencies):,} request dalam {elapsed:.1f} detik ({len(latencies) / elapsed:,.0f} req/s), '
+          f'{len(errors)} error')
+    print(f'latensi ms: p50 {np.percentile(latencies, 50):.2f}, p95 {np.percentile(latencies, 95):.2f}, '
+          f'p99 {np.percentile(latencies, 99):.2f}, max {latencies.max():.2f}')
+
+
+def wait_ready(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url + '/health') as response:
+                return response.read()
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f'service tidak siap dalam {timeout} detik')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--connections', type=int, default=32)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--url')
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f'http://127.0.0.1:{PORT}'
+        server = subprocess.Popen([sys.executable, 'service.py', str(PORT)], cwd=ROOT)
+    try:
+        wait_ready(url)
+        asyncio.run(run(url, args.connections, args.seconds))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
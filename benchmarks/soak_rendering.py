@@ -0,0 +1,39 @@
+# Soak test memori: rerun halaman berulang kali dan pantau RSS serta jumlah
+# figure. RSS harus mendatar setelah warm-up dan registry pyplot harus kosong.
+#
+#   python benchmarks/soak_rendering.py [jumlah_rerun] [halaman]
+import os
+import sys
+
+import matplotlib.pyplot as plt
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from rendering import current_rss_bytes  # noqa: E402
+
+
+def main():
+    reruns = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    page = sys.argv[2] if len(sys.argv) > 2 else 'Dashboard'
+
+    app = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=120)
+    app.run()
+    app.sidebar.selectbox[0].select(page).run()
+
+    print(f'{"rerun":>6} {"RSS (MB)":>10} {"figures (session)":>18} {"pyplot figures":>15}')
+    for rerun in range(1, reruns + 1):
+        if page == 'Forecasting':
+            app.button[0].click()
+        app.run()
+        if app.exception:
+            raise SystemExit(app.exception[0].value)
+        if rerun == 1 or rerun % max(1, reruns // 10) == 0:
+            print(f'{rerun:>6} {current_rss_bytes() / 1024 ** 2:>10.1f} '
+                  f'{app.session_state["figures_rendered"]:>18,} {len(plt.get_fignums()):>15}')
+
+
+if __name__ == '__main__':
+    main()
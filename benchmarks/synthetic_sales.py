@@ -0,0 +1,168 @@
+# Generator invoice sintetis yang mirip supermarket_sales.csv: 17 kolom yang
+# sama, kosakata Branch/City/Product line yang sama, distribusi kategori,
+# Quantity, jam, dan hari dalam minggu diambil dari CSV asli, Unit price dan
+# Rating diambil dari kuantil empirisnya, dan relasi cogs = Unit price x
+# Quantity, Tax 5% = 5% cogs, Total = cogs + Tax tetap berlaku. Baris ditulis
+# per chunk sehingga 10^8 baris tidak perlu muat di memori.
+#
+#   python benchmarks/synthetic_sales.py 1000000 [--output path.csv] [--days 1095] [--seed 0]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data_loader import DATA_URL, SCHEMA, read_csv  # noqa: E402
+
+OUTPUT_DIR = os.path.join(ROOT, '.cache', 'synthetic')
+CHUNK_ROWS = 1_000_000
+START_DATE = '2019-01-01'
+DAYS = 3 * 365
+
+# Invoice ID unik: indeks baris dipetakan secara bijektif ke 9 digit (pengali
+# relatif prima terhadap 10^9), lalu diformat seperti 750-67-8428
+ID_MULTIPLIER = 387_420_489
+ID_OFFSET = 750_678_428
+ID_SPACE = 10 ** 9
+
+GROSS_MARGIN_PERCENTAGE = 4.761904762
+TAX_RATE = 0.05
+QUANTILES = np.linspace(0, 1, 101)
+
+
+def _frequencies(values):
+    counts = values.value_counts(sort=False)
+    return counts.index.to_numpy(), (counts / counts.sum()).to_numpy()
+
+
+class InvoiceModel:
+    # Distribusi empiris dari CSV contoh; Branch dan City diambil berpasangan
+
+    def __init__(self, sample):
+        stores = sample[['Branch', 'City']].astype(str).value_counts(sort=False)
+        self.branch = stores.index.get_level_values('Branch').to_numpy()
+        self.city = stores.index.get_level_values('City').to_numpy()
+        self.stores = np.arange(len(stores)), (stores / stores.sum()).to_numpy()
+        self.categories = {column: _frequencies(sample[column].astype(str))
+                           for column in ['Customer type', 'Gender', 'Product line', 'Payment']}
+        self.quantity = _frequencies(sample['Quantity'])
+        self.hour = _frequencies(sample['Time'] // 60)
+        self.weekday = sample['Date'].dt.weekday.value_counts().reindex(range(7), fill_value=0).to_numpy()
+        self.unit_price = np.quantile(sample['Unit price'].astype('float64'), QUANTILES)
+        self.rating = np.quantile(sample['Rating'].astype('float64'), QUANTILES)
+
+    @classmethod
+    def from_csv(cls, path=DATA_URL):
+        return cls(read_csv(path))
+
+    def _choice(self, frequencies, rng, rows):
+        values, probabilities = frequencies
+        return values[rng.choice(len(values), size=rows, p=probabilities)]
+
+    def chunk(self, rows, first_row, rng, start=START_DATE, days=DAYS):
+        dates = pd.date_range(start, periods=days, freq='D')
+        day_weights = self.weekday[dates.weekday].astype('float64')
+        day = rng.choice(days, size=rows, p=day_weights / day_weights.sum())
+        minute = self._choice(self.hour, rng, rows) * 60 + rng.integers(0, 60, rows)
+
+        stores = self._choice(self.stores, rng, rows)
+        unit_price = np.round(np.interp(rng.random(rows), QUANTILES, self.unit_price), 2)
+        quantity = self._choice(self.quantity, rng, rows)
+        cogs = np.round(unit_price * quantity, 2)
+        tax = np.round(cogs * TAX_RATE, 4)
+
+        # Label tanggal/jam dari tabel kecil per hari/menit, tanpa format per baris
+        date_labels = np.array([f'{date.month}/{date.day}/{date.year}' for date in dates])
+        time_labels = np.array([f'{m // 60:02d}:{m % 60:02d}' for m in range(24 * 60)])
+
+        return pd.DataFrame({
+            'Invoice ID': invoice_ids(first_row, rows),
+            'Branch': self.branch[stores],
+            'City': self.city[stores],
+            'Customer type': self._choice(self.categories['Customer type'], rng, rows),
+            'Gender': self._choice(self.categories['Gender'], rng, rows),
+            'Product line': self._choice(self.categories['Product line'], rng, rows),
+            'Unit price': unit_price,
+            'Quantity': quantity,
+            'Tax 5%': tax,
+            'Total': np.round(cogs + tax, 4),
+            'Date': date_labels[day],
+            'Time': time_labels[minute],
+            'Payment': self._choice(self.categories['Payment'], rng, rows),
+            'cogs': cogs,
+            'gross margin percentage': GROSS_MARGIN_PERCENTAGE,
+            'gross income': tax,
+            'Rating': np.round(np.interp(rng.random(rows), QUANTILES, self.rating), 1),
+        }, columns=list(SCHEMA))
+
+
+def invoice_ids(first_row, rows):
+    if first_row + rows > ID_SPACE:
+        raise ValueError(f'maksimum {ID_SPACE:,} Invoice ID unik')
+    ids = (np.arange(first_row, first_row + rows, dtype='int64') * ID_MULTIPLIER + ID_OFFSET) % ID_SPACE
+    digits = (ids[:, None] // 10 ** np.arange(8, -1, -1)) % 10 + ord('0')
+    dash = np.full((rows, 1), ord('-'))
+    chars = np.hstack([digits[:, :3], dash, digits[:, 3:5], dash, digits[:, 5:]]).astype('uint8')
+    return chars.view('S11').ravel().astype('U11')
+
+
+def dataset_path(rows, seed=0, days=DAYS, directory=OUTPUT_DIR):
+    return os.path.join(directory, f'sales-{rows}-d{days}-s{seed}.csv')
+
+
+def generate(rows, path, seed=0, days=DAYS, chunk_rows=CHUNK_ROWS, model=None):
+    # Ditulis ke file sementara lalu di-rename; setiap chunk punya seed sendiri
+    # sehingga hasilnya sama untuk (rows, seed, days) yang sama. Writer CSV
+    # pyarrow ~8x lebih cepat dari DataFrame.to_csv
+    model = model or InvoiceModel.from_csv()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    writer = None
+    try:
+        for index, first_row in enumerate(range(0, rows, chunk_rows)):
+            rng = np.random.default_rng([seed, index])
+            chunk = model.chunk(min(chunk_rows, rows - first_row), first_row, rng, days=days)
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pa_csv.CSVWriter(path + '.tmp', table.schema,
+                                          write_options=pa_csv.WriteOptions(quoting_style='needed'))
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def ensure_dataset(rows, seed=0, days=DAYS):
+    # Dataset dengan parameter yang sama dipakai ulang antar benchmark
+    path = dataset_path(rows, seed, days)
+    if not os.path.exists(path):
+        generate(rows, path, seed, days)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Buat invoice sintetis dengan skema supermarket_sales.csv')
+    parser.add_argument('rows', type=int)
+    parser.add_argument('--output')
+    parser.add_argument('--days', type=int, default=DAYS, help='rentang tanggal mulai 2019-01-01')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    path = args.output or dataset_path(args.rows, args.seed, args.days)
+    start = time.perf_counter()
+    generate(args.rows, path, args.seed, args.days, args.chunk_rows)
+    print(f'{args.rows:,} baris ditulis ke {path} ({os.path.getsize(path) / 1024 ** 2:,.1f} MB, '
+          f'{time.perf_counter() - start:.1f} s)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+import snapshot
+from instrumentation import stage
+
+# Lokasi dataset default
+DATA_URL = 'supermarket_sales.csv'
+
+# Format tanggal dan jam pada CSV (contoh: 1/5/2019, 13:08)
+DATE_FORMAT = '%m/%d/%Y'
+TIME_FORMAT = '%H:%M'
+
+# Dinaikkan setiap kali tipe kolom hasil clean_data berubah, supaya snapshot
+# lama dibuat ulang walaupun CSV-nya tidak berubah
+SCHEMA_VERSION = 2
+
+CATEGORICAL_COLUMNS = ['Branch', 'City', 'Customer type', 'Gender', 'Product line', 'Payment']
+
+# Kolom yang dibutuhkan tiap halaman; halaman lain membaca semua kolom
+PAGE_COLUMNS = {
+    'Dashboard': ['Invoice ID', 'Date', 'Branch', 'City', 'Product line', 'Total', 'Quantity', 'Rating'],
+    'Forecasting': ['Date', 'Branch', 'Total', 'Quantity', 'Product line'],
+}
+
+# Skema tipe data eksplisit agar pandas tidak perlu menebak tipe setiap kolom.
+# Kolom uang yang dijumlahkan (Total, Tax 5%, cogs, gross income) tetap float64
+# supaya agregasi jutaan baris tidak kehilangan presisi. Time dibaca sebagai
+# teks lalu disimpan sebagai menit sejak tengah malam (int16).
+SCHEMA = {
+    'Invoice ID': 'object',
+    'Branch': 'category',
+    'City': 'category',
+    'Customer type': 'category',
+    'Gender': 'category',
+    'Product line': 'category',
+    'Unit price': 'float32',
+    'Quantity': 'int16',
+    'Tax 5%': 'float64',
+    'Total': 'float64',
+    'Date': 'object',
+    'Time': 'object',
+    'Payment': 'category',
+    'cogs': 'float64',
+    'gross margin percentage': 'float32',
+    'gross income': 'float64',
+    'Rating': 'float32',
+}
+
+
+def data_version(path=DATA_URL):
+    # Versi data ditentukan oleh mtime dan ukuran file
+    stat = os.stat(path)
+    return f'{stat.st_mtime_ns}-{stat.st_size}'
+
+
+def parse_time(time):
+    # 'HH:MM' -> menit sejak tengah malam (int16), tanpa objek datetime.time per baris
+    parsed = pd.to_datetime(time, format=TIME_FORMAT)
+    return (parsed.dt.hour * 60 + parsed.dt.minute).astype('int16')
+
+
+def hour_of_day(time):
+    return (time // 60).astype('int8')
+
+
+def add_time_features(data):
+    # Hour dan Timestamp (Date + Time) untuk analisis per jam; frame baru
+    return data.assign(Hour=hour_of_day(data['Time']),
+                       Timestamp=data['Date'] + pd.to_timedelta(data['Time'], unit='min'))
+
+
+def clean_data(data):
+    data['Date'] = pd.to_datetime(data['Date'], format=DATE_FORMAT)
+    if 'Time' in data:
+        data['Time'] = parse_time(data['Time'])
+    return data
+
+
+def read_csv(path=DATA_URL, columns=None):
+    dtype = {column: SCHEMA[column] for column in columns} if columns else SCHEMA
+    with stage('csv_read') as info:
+        data = pd.read_csv(path, usecols=columns, dtype=dtype)
+        info['rows'] = len(data)
+    with stage('date_parse', rows=len(data)):
+        return clean_data(data)
+
+
+def convert_snapshot(path=DATA_URL, version=None):
+    # Menulis snapshot kolumnar (Parquet, dipartisi per bulan) di samping CSV;
+    # versi CSV diambil sebelum dibaca, jadi CSV yang berubah selama konversi
+    # membuat snapshot ini langsung dianggap basi
+    version = version or data_version(path)
+    return snapshot.write_snapshot(read_csv(path), snapshot.snapshot_path(path), SCHEMA_VERSION, version)
+
+
+def _stats(data, start, source):
+    return {
+        'rows': len(data),
+        'load_seconds': time.perf_counter() - start,
+        'memory_bytes': int(data.memory_usage(deep=True).sum()),
+        'source': source,
+    }
+
+
+# Frame di-cache sebagai resource (tanpa pickle/salin per rerun) dan dipakai
+# bersama oleh semua session; aman karena copy-on-write pandas, asalkan frame
+# hasil load tidak diubah in-place. Satu entri per set kolom halaman, untuk
+# versi data sekarang dan sebelumnya.
+LOAD_CACHE_ENTRIES = 8
+
+
+@st.cache_resource(show_spinner='Memuat dataset...', max_entries=LOAD_CACHE_ENTRIES)
+def _load_csv(path, version, columns):
+    start = time.perf_counter()
+    data = read_csv(path, list(columns) if columns else None)
+    return data, _stats(data, start, 'csv')
+
+
+@st.cache_resource(show_spinner='Memuat dataset...', max_entries=LOAD_CACHE_ENTRIES)
+def _load_snapshot(path, version, columns):
+    start = time.perf_counter()
+    if not snapshot.is_fresh(path, version, schema_version=SCHEMA_VERSION):
+        with stage('snapshot_write'):
+            convert_snapshot(path, version)
+    with stage('snapshot_read') as info:
+        data = snapshot.read_snapshot(snapshot.snapshot_path(path), columns)
+        info['rows'] = len(data)
+    return data, _stats(data, start, 'parquet')
+
+
+def load_data(path=DATA_URL, columns=None, use_snapshot=True):
+    # Hasil di-cache lintas rerun dan session, dan otomatis diinvalidasi
+    # ketika mtime atau ukuran file berubah. Snapshot Parquet dipakai bila
+    # tersedia (dan dibuat otomatis bila belum ada atau lebih lama dari CSV).
+    columns = tuple(columns) if columns else None
+    if use_snapshot:
+        return _load_snapshot(path, data_version(path), columns)
+    return _load_csv(path, data_version(path), columns)
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from instrumentation import timed
+
+# Downsampling seri waktu sebelum digambar: grafik selebar W piksel tidak bisa
+# menampilkan lebih dari satu nilai min dan max per kolom piksel, jadi seri
+# panjang dipangkas menjadi anggaran titik yang sebanding dengan lebar grafik.
+#
+#   minmax: titik minimum dan maksimum tiap bucket (puncak dan lembah tetap persis)
+#   lttb:   Largest-Triangle-Three-Buckets, satu titik per bucket yang paling
+#           menjaga bentuk visual (lebih sedikit titik, puncak bisa bergeser)
+
+# Lebar grafik default dalam piksel (st.line_chart selebar kolom konten)
+CHART_WIDTH_PX = 800
+
+# DPI yang dipakai saat figure matplotlib diserialisasi ke PNG (st.pyplot, figure_png)
+FIGURE_DPI = 200
+
+
+def point_budget(width_px=CHART_WIDTH_PX, method='minmax'):
+    # minmax: dua titik per kolom piksel; lttb: satu titik per kolom piksel
+    return int(width_px) * (2 if method == 'minmax' else 1)
+
+
+def figure_width_px(fig, dpi=FIGURE_DPI):
+    return fig.get_figwidth() * dpi
+
+
+def _x_values(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype('int64')
+    return x.astype('float64')
+
+
+def minmax_indices(y, max_points):
+    # Posisi titik pertama, terakhir, dan min/max tiap bucket (NaN diabaikan)
+    y = np.asarray(y, dtype='float64')
+    n = len(y)
+    buckets = (max_points - 2) // 2
+    if n <= max_points or buckets < 1:
+        return np.arange(n)
+    edges = np.linspace(0, n, buckets + 1).astype('int64')
+    bucket = np.repeat(np.arange(buckets), np.diff(edges))
+    selected = [np.array([0, n - 1])]
+    for reduce in (np.fmin, np.fmax):
+        extremes = reduce.reduceat(y, edges[:-1])
+        hits = np.flatnonzero(y == extremes[bucket])
+        # Satu posisi per bucket (kemunculan pertama)
+        selected.append(hits[np.unique(bucket[hits], return_index=True)[1]])
+    return np.unique(np.concatenate(selected))
+
+
+def lttb_indices(x, y, max_points):
+    # Bucket pertama dan terakhir hanya berisi titik ujung; untuk tiap bucket di
+    # antaranya dipilih titik yang membentuk segitiga terbesar dengan titik
+    # terpilih sebelumnya dan rata-rata bucket berikutnya
+    x, y = _x_values(x), np.asarray(y, dtype='float64')
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, max_points - 1).astype('int64')
+    selected = np.empty(max_points, dtype='int64')
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs((x[previous] - next_x) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (next_y - y[previous]))
+        previous = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = previous
+    return selected
+
+
+@timed('downsample', rows=len)
+def downsample(data, max_points=None, x=None, method='minmax'):
+    # Series atau DataFrame yang terurut menurut x (kolom `x`, atau indeks bila
+    # None); mengembalikan baris terpilih tanpa menyalin bila sudah di bawah
+    # anggaran. Untuk DataFrame, titik terpilih adalah gabungan pilihan tiap
+    # kolom numerik, jadi puncak setiap seri (mis. P10/P90) tetap ada.
+    max_points = max_points or point_budget(method=method)
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    columns = [column for column in frame.columns
+               if column != x and pd.api.types.is_numeric_dtype(frame[column])]
+    if len(data) <= max_points or not columns:
+        return data
+    x_values = frame.index if x is None else frame[x]
+    per_column = max(max_points // max(len(columns), 1), 3)
+    if method == 'lttb':
+        positions = [lttb_indices(x_values, frame[column], per_column) for column in columns]
+    else:
+        positions = [minmax_indices(frame[column], per_column) for column in columns]
+    return data.iloc[np.unique(np.concatenate(positions))]
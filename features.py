@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+
+from data_loader import CATEGORICAL_COLUMNS
+from instrumentation import timed
+
+# Matriks fitur sparse (CSR) untuk model yang lebih kaya dari regresi indeks
+# minggu: one-hot kolom kategorikal dan field kalender dibangun langsung dari
+# kode kategori (tanpa pd.get_dummies yang padat), ditambah kolom numerik dan
+# tren. Hasilnya bisa langsung dipakai estimator sklearn yang menerima input
+# sparse (mis. Ridge, SGDRegressor, LinearSVR).
+
+# Field kalender: nama -> (fungsi dari accessor .dt ke kode 0-based, jumlah kategori)
+CALENDAR_FIELDS = {
+    'Month': (lambda dates: dates.month - 1, 12),
+    'Day': (lambda dates: dates.day - 1, 31),
+    'Weekday': (lambda dates: dates.weekday, 7),
+}
+
+
+class SparseFeatures(TransformerMixin, BaseEstimator):
+    # fit() mencatat kosakata tiap kolom kategorikal dan tanggal awal tren;
+    # transform() hanya memetakan kode, sehingga baris baru (mis. periode masa
+    # depan) mendapat kolom yang sama. Kategori yang tidak dikenal atau kosong
+    # tidak punya entri (baris nol pada blok itu). Parameter konstruktor
+    # disimpan apa adanya (get_params/clone sklearn).
+
+    def __init__(self, categorical=tuple(CATEGORICAL_COLUMNS), calendar=tuple(CALENDAR_FIELDS), numeric=(),
+                 date_column='Date', trend=True):
+        self.categorical = categorical
+        self.calendar = calendar
+        self.numeric = numeric
+        self.date_column = date_column
+        self.trend = trend
+
+    def fit(self, data, y=None):
+        self.categories_ = {}
+        for column in self.categorical:
+            values = data[column]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype('category')
+            self.categories_[column] = values.cat.categories
+        self.start_ = data[self.date_column].min()
+        names = [f'{column}_{category}' for column in self.categorical for category in self.categories_[column]]
+        names += [f'{field}_{code + 1 if field != "Weekday" else code}'
+                  for field in self.calendar for code in range(CALENDAR_FIELDS[field][1])]
+        self.n_onehot_ = len(names)
+        names += list(self.numeric) + (['trend_weeks'] if self.trend else [])
+        self.feature_names_ = np.array(names, dtype=object)
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        return self.feature_names_
+
+    def _codes(self, data):
+        # (kode 0-based, offset kolom) per blok one-hot; kode -1 = tidak ada entri
+        blocks, offset = [], 0
+        for column in self.categorical:
+            categories = self.categories_[column]
+            values = data[column]
+            if isinstance(values.dtype, pd.CategoricalDtype) and values.cat.categories.equals(categories):
+                codes = values.cat.codes.to_numpy()
+            else:
+                codes = pd.Categorical(values, categories=categories).codes
+            blocks.append((codes, offset))
+            offset += len(categories)
+        dates = data[self.date_column].dt
+        for field in self.calendar:
+            to_code, size = CALENDAR_FIELDS[field]
+            blocks.append((np.asarray(to_code(dates)), offset))
+            offset += size
+        return blocks
+
+    @timed('sparse_features', rows=lambda matrix: matrix.shape[0])
+    def transform(self, data):
+        rows = len(data)
+        blocks = self._codes(data)
+        dense = [data[column].to_numpy(dtype='float64') for column in self.numeric]
+        if self.trend:
+            dense.append(((data[self.date_column] - self.start_).dt.days / 7).to_numpy(dtype='float64'))
+
+        # Kolom setiap baris sudah terurut (blok one-hot berurutan, lalu numerik),
+        # jadi indices/data CSR diisi langsung ke buffer (baris x entri) tanpa
+        # konversi COO; entri dengan kode -1 dibuang hanya bila ada
+        width = len(blocks) + len(dense)
+        index_dtype = np.int32 if rows * width < np.iinfo(np.int32).max else np.int64
+        indices = np.empty((rows, width), dtype=index_dtype)
+        values = np.ones((rows, width))
+        for i, (codes, offset) in enumerate(blocks):
+            np.add(codes, offset, out=indices[:, i], casting='unsafe')
+            indices[codes < 0, i] = -1
+        for i, column in enumerate(dense, start=len(blocks)):
+            indices[:, i] = self.n_onehot_ + i - len(blocks)
+            values[:, i] = column
+
+        counts = np.full(rows, width)
+        if len(blocks) and (indices[:, :len(blocks)] < 0).any():
+            present = indices >= 0
+            counts = present.sum(axis=1)
+            indices, values = indices[present], values[present]
+        indptr = np.zeros(rows + 1, dtype=index_dtype)
+        np.cumsum(counts, out=indptr[1:])
+        return sp.csr_matrix((values.ravel(), indices.ravel(), indptr), shape=(rows, len(self.feature_names_)))
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+class FilterIndex:
+    # Indeks filter untuk sidebar Dashboard:
+    # - data diurutkan berdasarkan tanggal, sehingga rentang tanggal menjadi
+    #   slice hasil binary search (np.searchsorted)
+    # - setiap kolom kategorikal punya bitmap posisi baris per kategori,
+    #   sehingga multiselect menjadi operasi OR/AND pada bitmap
+
+    def __init__(self, data, date_column='Date', columns=('Branch', 'City')):
+        if not data[date_column].is_monotonic_increasing:
+            data = data.sort_values(date_column, kind='stable', ignore_index=True)
+        self.data = data
+        self.dates = data[date_column].to_numpy()
+        self.bitmaps = {}
+        for column in columns:
+            values = data[column].astype('category')
+            codes = values.cat.codes.to_numpy()
+            self.bitmaps[column] = {category: codes == code for code, category in enumerate(values.cat.categories)}
+
+    def categories(self, column):
+        return list(self.bitmaps[column])
+
+    def date_range(self):
+        return self.dates[0], self.dates[-1]
+
+    def date_slice(self, start, end):
+        lo = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start)), side='left')
+        hi = np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end)), side='right')
+        return lo, max(lo, hi)
+
+    def mask(self, lo, hi, selections):
+        # None berarti tidak ada kolom yang membatasi (semua kategori dipilih)
+        mask = None
+        for column, selected in selections.items():
+            bitmaps = self.bitmaps[column]
+            selected = set(selected)
+            if selected.issuperset(bitmaps):
+                continue
+            column_mask = np.zeros(hi - lo, dtype=bool)
+            for category in selected & set(bitmaps):
+                column_mask |= bitmaps[category][lo:hi]
+            mask = column_mask if mask is None else mask & column_mask
+        return mask
+
+    def positions(self, start, end, selections=None):
+        # Posisi baris yang lolos filter: slice bila hanya rentang tanggal,
+        # atau array posisi bila ada filter kategori
+        lo, hi = self.date_slice(start, end)
+        mask = self.mask(lo, hi, selections or {})
+        if mask is None:
+            return slice(lo, hi)
+        return lo + np.flatnonzero(mask)
+
+    def filter(self, start, end, selections=None):
+        lo, hi = self.date_slice(start, end)
+        view = self.data.iloc[lo:hi]
+        mask = self.mask(lo, hi, selections or {})
+        if mask is None:
+            # Hanya rentang tanggal: hasilnya view tanpa menyalin baris
+            return view
+        return view[mask]
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_filter_index(_data, version):
+    # Satu indeks per versi data, dipakai bersama oleh semua session (read-only);
+    # hanya versi sekarang dan sebelumnya yang disimpan
+    return FilterIndex(_data)
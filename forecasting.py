@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from instrumentation import timed
+
+
+@timed('calendar_features', rows=len)
+def add_calendar_features(data):
+    # Fitur Month, Day, Weekday dari kolom Date; mengembalikan frame baru
+    # supaya frame `data` yang di-cache bersama tidak ikut berubah
+    dates = data['Date'].dt
+    return data.assign(Month=dates.month, Day=dates.day, Weekday=dates.weekday)
+
+
+def daily_sales(data):
+    # Agregasi penjualan harian: total penjualan dan jumlah barang terjual
+    return data.groupby('Date')[['Total', 'Quantity']].sum()
+
+
+# Granularitas forecast: kode -> (alias frekuensi pandas, alias periode)
+GRANULARITIES = {
+    'D': ('D', 'D'),
+    'W': ('W', 'W-SUN'),
+    'M': ('ME', 'M'),
+}
+
+# Cache yang dikunci versi store: versi sekarang dan sebelumnya, untuk beberapa
+# granularitas dan parameter sekaligus; entri versi lama dibuang
+VERSION_CACHE_ENTRIES = 16
+
+
+@timed('period_sales', rows=len)
+def period_sales(daily, granularity='W'):
+    # Total penjualan per hari/minggu/bulan dari agregat harian dalam satu pass:
+    # hari tanpa penjualan diisi 0, lalu total tiap periode adalah selisih
+    # cumulative sum pada hari terakhir periode (tanpa groupby/resample ulang).
+    # Label periode sama dengan resample(): tanggal itu sendiri, hari Minggu
+    # akhir minggu, atau akhir bulan.
+    days = pd.date_range(daily.index.min(), daily.index.max(), freq='D')
+    totals = daily['Total'].reindex(days, fill_value=0.0).to_numpy(dtype='float64')
+    if granularity == 'D':
+        return pd.Series(totals, index=days, name='Total')
+
+    labels = days.to_period(GRANULARITIES[granularity][1]).end_time.normalize()
+    last_days = np.append(np.flatnonzero(labels[1:] != labels[:-1]), len(days) - 1)
+    sums = np.diff(np.cumsum(totals)[last_days], prepend=0.0)
+    return pd.Series(sums, index=pd.DatetimeIndex(labels[last_days], name='Date'), name='Total')
+
+
+def weekly_sales(daily):
+    # Penjualan mingguan (minggu berakhir hari Minggu), sama dengan resample('W')
+    return period_sales(daily, 'W')
+
+
+def future_periods(series, periods, granularity='W'):
+    return pd.date_range(start=series.index[-1], periods=periods + 1, freq=GRANULARITIES[granularity][0])[1:]
+
+
+@timed('forecast_predict', rows=len)
+def forecast(model, series, periods, granularity='W'):
+    # Indeks periode masa depan melanjutkan indeks periode data historis
+    last_index = len(series)
+    future_index = np.arange(last_index, last_index + periods).reshape(-1, 1)
+    future_predictions = model.predict(future_index)
+    return pd.DataFrame(data=future_predictions, index=future_periods(series, periods, granularity),
+                        columns=['Predicted Sales'])
+
+
+class PeriodRegression:
+    # Regresi indeks periode (intercept + slope, penalti ridge pada slope) untuk
+    # granularitas yang tidak punya model pickle; di-fit dengan fit_batch dan
+    # punya predict() seperti estimator sklearn
+
+    def __init__(self, alpha=0.0):
+        self.alpha = alpha
+
+    def fit(self, series):
+        self.intercept_, self.slope_ = fit_batch(series.to_numpy(dtype='float64')[None, :], self.alpha)[:, 0]
+        return self
+
+    def predict(self, X):
+        return self.intercept_ + self.slope_ * np.asarray(X, dtype='float64')[:, 0]
+
+
+@st.cache_data(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def get_period_sales(_daily, version, granularity='W'):
+    return period_sales(_daily, granularity)
+
+
+@st.cache_resource(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def get_period_model(_series, version, granularity, alpha=0.0):
+    return PeriodRegression(alpha).fit(_series)
+
+
+# Batch forecasting: satu regresi indeks minggu per grup (mis. Branch x Product
+# line), semuanya di-fit dengan satu solve least squares atas matriks
+# (grup x minggu) dan diprediksi dengan satu perkalian matriks.
+
+def weekly_sales_matrix(data, by=('Branch', 'Product line')):
+    # Baris: kombinasi grup, kolom: minggu (minggu tanpa penjualan bernilai 0)
+    by = list(by)
+    weekly = data.groupby(by + [pd.Grouper(key='Date', freq='W')], observed=True)['Total'].sum()
+    matrix = weekly.unstack(fill_value=0.0)
+    weeks = pd.date_range(matrix.columns.min(), matrix.columns.max(), freq='W')
+    return matrix.reindex(columns=weeks, fill_value=0.0).astype('float64')
+
+
+def week_design(start, periods):
+    # Matriks desain [1, indeks minggu]
+    weeks = np.arange(start, start + periods, dtype='float64')
+    return np.column_stack([np.ones(periods), weeks])
+
+
+def fit_batch(Y, alpha=0.0):
+    # Y: (grup x minggu). Menyelesaikan (X'X + alpha * P) B = X'Y' sekaligus untuk
+    # semua grup; P hanya menalti slope (setara Ridge/LinearRegression sklearn
+    # dengan fit_intercept=True). Hasil B: (2 x grup) berisi intercept dan slope.
+    X = week_design(0, Y.shape[1])
+    penalty = np.diag([0.0, alpha])
+    return np.linalg.solve(X.T @ X + penalty, X.T @ Y.T)
+
+
+def predict_batch(coef, start, weeks_ahead):
+    # (horizon x grup)
+    return week_design(start, weeks_ahead) @ coef
+
+
+@timed('batch_forecast', rows=len)
+def batch_forecast(matrix, weeks_ahead, alpha=0.0):
+    coef = fit_batch(matrix.to_numpy(), alpha=alpha)
+    predictions = predict_batch(coef, matrix.shape[1], weeks_ahead)
+
+    future_dates = pd.date_range(start=matrix.columns[-1], periods=weeks_ahead + 1, freq='W')[1:]
+    frame = pd.DataFrame(predictions.T, index=matrix.index, columns=future_dates)
+    frame.columns.name = 'Date'
+    return frame.stack().rename('Predicted Sales').reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=VERSION_CACHE_ENTRIES)
+def get_weekly_sales_matrix(_data, version, by=('Branch', 'Product line')):
+    return weekly_sales_matrix(_data, by)
+
+
+# Interval prediksi dengan residual bootstrap di sekitar model yang ditampilkan:
+# residual dihitung dari fitted value model itu sendiri (model.predict), seri
+# residual yang di-resample di-fit sekaligus sebagai satu batch lewat fit_batch
+# (regresi indeks periode linear terhadap y, jadi refit fitted + residual =
+# model + refit residual), lalu prediksi ditambah residual acak untuk noise
+# periode depan. Kuantil atas semua sampel menjadi P10/P50/P90; rata-rata
+# sampel sama dengan prediksi model, P50 bisa bergeser bila residual miring.
+
+BOOTSTRAP_SAMPLES = 2000
+INTERVAL_QUANTILES = {'P10': 0.1, 'P50': 0.5, 'P90': 0.9}
+
+
+@timed('bootstrap_intervals')
+def bootstrap_intervals(model, series, periods, granularity='W', samples=BOOTSTRAP_SAMPLES, seed=0):
+    y = series.to_numpy(dtype='float64')
+    fitted = model.predict(np.arange(len(y)).reshape(-1, 1))
+    predicted = model.predict(np.arange(len(y), len(y) + periods).reshape(-1, 1))
+    residuals = y - fitted
+    residuals = residuals - residuals.mean()
+
+    rng = np.random.default_rng(seed)
+    E = rng.choice(residuals, size=(samples, len(y)))
+    paths = predicted + predict_batch(fit_batch(E, alpha=getattr(model, 'alpha', 0.0)), len(y), periods).T
+    paths += rng.choice(residuals, size=paths.shape)
+
+    bands = np.quantile(paths, list(INTERVAL_QUANTILES.values()), axis=0).T
+    return pd.DataFrame(bands, index=future_periods(series, periods, granularity), columns=list(INTERVAL_QUANTILES))
+
+
+@st.cache_data(show_spinner='Menghitung interval prediksi...', max_entries=VERSION_CACHE_ENTRIES)
+def get_forecast_intervals(_model, model_key, _series, version, periods, granularity='W'):
+    # model_key: digest artifact model (model pickle, atau asal alpha model periode)
+    return bootstrap_intervals(_model, _series, periods, granularity)
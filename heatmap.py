@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+# Heatmap Hour x Date: agregasi dengan np.bincount atas (jam, kode periode),
+# sumbu tanggal diturunkan resolusinya (hari -> minggu -> bulan) bila rentang
+# terlalu lebar, lalu digambar dengan imshow (satu gambar, bukan sel per sel).
+
+MAX_COLUMNS = 120
+HOURS = 24
+
+
+def choose_frequency(first_day, last_day, max_columns=MAX_COLUMNS):
+    days = int(last_day - first_day) + 1
+    if days <= max_columns:
+        return 'D'
+    if days / 7 <= max_columns:
+        return 'W'
+    return 'M'
+
+
+def period_codes(days, freq):
+    # days: hari sejak epoch (int64) -> kode periode berurutan
+    if freq == 'D':
+        return days
+    if freq == 'W':
+        # Minggu Senin-Minggu seperti resample('W'); 1970-01-01 adalah hari Kamis
+        return (days + 3) // 7
+    return days.astype('datetime64[D]').astype('datetime64[M]').astype('int64')
+
+
+def period_labels(codes, freq):
+    # Tanggal label per kode: hari itu sendiri, hari Minggu akhir minggu, atau awal bulan
+    if freq == 'D':
+        labels = codes.astype('datetime64[D]')
+    elif freq == 'W':
+        labels = (codes * 7 + 3).astype('datetime64[D]')
+    else:
+        labels = codes.astype('datetime64[M]')
+    return pd.DatetimeIndex(labels.astype('datetime64[ns]'))
+
+
+def hour_date_matrix(hours, dates, values, freq=None, max_columns=MAX_COLUMNS):
+    # Mengembalikan (matrix jam x periode, label jam, label periode, freq);
+    # sel tanpa transaksi di-mask agar tampil kosong seperti NaN pada pivot_table
+    days = np.asarray(dates, dtype='datetime64[D]').astype('int64')
+    hours = np.asarray(hours, dtype='int64')
+    freq = freq or choose_frequency(days.min(), days.max(), max_columns)
+
+    codes = period_codes(days, freq)
+    first = codes.min()
+    columns = int(codes.max() - first) + 1
+    index = hours * columns + (codes - first)
+    totals = np.bincount(index, weights=values, minlength=HOURS * columns).reshape(HOURS, columns)
+    counts = np.bincount(index, minlength=HOURS * columns).reshape(HOURS, columns)
+
+    # Hanya rentang jam yang pernah ada transaksi
+    active = np.flatnonzero(counts.any(axis=1))
+    rows = slice(active[0], active[-1] + 1)
+    matrix = np.ma.masked_where(counts[rows] == 0, totals[rows])
+    return matrix, np.arange(HOURS)[rows], period_labels(np.arange(first, first + columns), freq), freq
+
+
+def plot_heatmap(ax, matrix, hours, labels, freq, cmap='YlGnBu', max_ticks=20):
+    image = ax.imshow(matrix, aspect='auto', cmap=cmap, interpolation='nearest')
+    ax.figure.colorbar(image, ax=ax)
+
+    step = max(1, int(np.ceil(len(labels) / max_ticks)))
+    date_format = {'D': '%Y-%m-%d', 'W': '%Y-%m-%d', 'M': '%Y-%m'}[freq]
+    ax.set_xticks(np.arange(0, len(labels), step))
+    ax.set_xticklabels(labels[::step].strftime(date_format), rotation=90)
+    ax.set_yticks(np.arange(len(hours)))
+    ax.set_yticklabels(hours)
+    ax.set_xlabel({'D': 'Date', 'W': 'Week', 'M': 'Month'}[freq])
+    ax.set_ylabel('Hour')
@@ -0,0 +1,245 @@
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from data_loader import SCHEMA, clean_data, data_version, load_data
+from forecasting import daily_sales
+from instrumentation import stage, timed
+from profiling import build_profile, get_profile
+from rollup import ROLLUP_KEYS, build_rollup
+
+# Direktori tempat file invoice baru (CSV dengan kolom yang sama) diletakkan.
+# Penulis sebaiknya menulis ke nama lain (mis. batch.csv.tmp) lalu me-rename
+# ke *.csv; file .csv yang diubah kurang dari SETTLE_SECONDS lalu dianggap
+# masih ditulis dan baru diambil pada poll berikutnya
+DROP_DIR = 'incoming'
+SETTLE_SECONDS = 2.0
+
+# Kolom yang dibutuhkan store untuk dedup dan agregat
+STORE_COLUMNS = ['Invoice ID', 'Date', 'Branch', 'City', 'Product line', 'Total', 'Quantity', 'Rating']
+
+# Jumlah maksimum array hash Invoice ID, dan frame batch, sebelum digabung menjadi satu
+MAX_ID_RUNS = 8
+MAX_DELTAS = 8
+
+logger = logging.getLogger(__name__)
+
+
+def validate_batch(batch):
+    # Kolom harus sama dengan skema CSV, tipe harus bisa dikonversi, dan tidak boleh ada nilai kosong
+    missing = [column for column in SCHEMA if column not in batch]
+    extra = [column for column in batch if column not in SCHEMA]
+    if missing or extra:
+        raise ValueError(f'kolom batch tidak sesuai skema (kurang: {missing}, lebih: {extra})')
+    nulls = batch.columns[batch.isnull().any()].tolist()
+    if nulls:
+        raise ValueError(f'batch memiliki nilai kosong pada kolom {nulls}')
+
+    batch = batch[list(SCHEMA)].copy()
+    try:
+        if not pd.api.types.is_datetime64_any_dtype(batch['Date']):
+            batch = clean_data(batch.astype(SCHEMA))
+        else:
+            batch = batch.astype({column: dtype for column, dtype in SCHEMA.items()
+                                  if column not in ('Date', 'Time')})
+    except (ValueError, TypeError) as error:
+        raise ValueError(f'tipe data batch tidak valid: {error}') from error
+    return batch
+
+
+def hash_ids(ids):
+    return pd.util.hash_array(np.asarray(ids, dtype=object))
+
+
+def merge_rollups(rollups):
+    # Rollup bersifat mergeable: gabungkan lalu jumlahkan per kunci
+    merged = concat_frames(rollups).groupby(ROLLUP_KEYS, observed=True, as_index=False).sum()
+    return merged.sort_values('Date', kind='stable', ignore_index=True)
+
+
+def concat_frames(frames):
+    # Menyamakan kategori sebelum concat supaya kolom kategorikal tidak berubah menjadi object
+    frames = [frame for frame in frames if len(frame)]
+    for column in frames[0].columns:
+        if isinstance(frames[0][column].dtype, pd.CategoricalDtype):
+            categories = pd.Index(pd.unique(np.concatenate([frame[column].cat.categories.to_numpy()
+                                                            for frame in frames])))
+            frames = [frame.assign(**{column: frame[column].cat.set_categories(categories)}) for frame in frames]
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+class SalesStore:
+    # Data dasar dari file ditambah batch invoice baru. Setiap ingest hanya
+    # mengagregasi delta lalu menggabungkannya ke agregat harian dan rollup
+    # dashboard (seri per periode diturunkan dari agregat harian lewat
+    # get_period_sales); data dasar tidak dibaca ulang.
+
+    def __init__(self, rollup, base_version, id_hashes=None):
+        # Agregat harian diturunkan dari rollup (Date x Branch x City x Product line),
+        # jadi store bisa dibangun dari data lengkap maupun dari hasil streaming
+        self.base_version = base_version
+        self.batches = 0
+        self.deltas = []
+        self.id_runs = [np.sort(id_hashes)] if id_hashes is not None and len(id_hashes) else []
+        self.rollup = rollup
+        self.daily = daily_sales(rollup)
+        self._rows = {}
+        self._profiles = {}
+        self._applied = set()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+
+    @classmethod
+    @timed('store_build')
+    def from_data(cls, data, base_version):
+        return cls(build_rollup(data), base_version, hash_ids(data['Invoice ID']))
+
+    @property
+    def version(self):
+        return f'{self.base_version}+{self.batches}'
+
+    def _known(self, hashes):
+        known = np.zeros(len(hashes), dtype=bool)
+        for run in self.id_runs:
+            if len(run) == 0:
+                continue
+            positions = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            known |= run[positions] == hashes
+        return known
+
+    def _remember(self, hashes):
+        self.id_runs.append(np.sort(hashes))
+        if len(self.id_runs) > MAX_ID_RUNS:
+            self.id_runs = [np.sort(np.concatenate(self.id_runs))]
+
+    def ingest(self, batch):
+        with stage('ingest', rows=len(batch)):
+            return self._ingest(batch)
+
+    def _ingest(self, batch):
+        batch = validate_batch(batch)
+        batch = batch.drop_duplicates('Invoice ID')
+        hashes = hash_ids(batch['Invoice ID'])
+        with self._lock:
+            new = ~self._known(hashes)
+            batch, hashes = batch[new], hashes[new]
+            if len(batch) == 0:
+                return 0
+
+            # Agregat baru dibuat lalu ditukar, sehingga pembaca di session lain
+            # selalu melihat agregat yang konsisten
+            delta = build_rollup(batch)
+            daily = self.daily.add(daily_sales(delta), fill_value=0)
+            rollup = self._merge_rollup(delta)
+
+            self._remember(hashes)
+            deltas = self.deltas + [batch.reset_index(drop=True)]
+            if len(deltas) > MAX_DELTAS:
+                deltas = [concat_frames(deltas)]
+            self.daily, self.rollup, self.deltas = daily, rollup, deltas
+            self._rows = {}
+            self.batches += 1
+            return len(batch)
+
+    def _merge_rollup(self, delta):
+        # Hanya baris rollup pada tanggal yang tersentuh delta yang diagregasi ulang
+        touched = self.rollup['Date'].isin(delta['Date'].unique())
+        merged = merge_rollups([self.rollup[touched], delta])
+        return concat_frames([self.rollup[~touched], merged]).sort_values('Date', kind='stable', ignore_index=True)
+
+    def poll(self, drop_dir=DROP_DIR):
+        # File CSV baru di drop directory diklaim dengan os.replace ke
+        # processing/<pid>/ (atomik; bila file sudah hilang, proses lain sudah
+        # mengambilnya), lalu yang lolos validasi dipindah ke processed/ dan yang
+        # gagal ke rejected/. processed/ adalah log batch yang diterima: setiap
+        # store (worker lain, store streaming/shared, atau store baru setelah
+        # restart atau versi data dasar baru) menerapkan file di sana yang belum
+        # pernah diterapkannya; dedup Invoice ID membuat replay aman
+        if not os.path.isdir(drop_dir):
+            return 0
+        with self._poll_lock:
+            return self._claim_new(drop_dir) + self._replay_processed(drop_dir)
+
+    def _claim_new(self, drop_dir):
+        settled = time.time() - SETTLE_SECONDS
+        names = sorted(entry.name for entry in os.scandir(drop_dir)
+                       if entry.is_file() and entry.name.endswith('.csv') and entry.stat().st_mtime < settled)
+        claim_dir = os.path.join(drop_dir, 'processing', str(os.getpid()))
+        added = 0
+        for name in names:
+            claimed = os.path.join(claim_dir, name)
+            os.makedirs(claim_dir, exist_ok=True)
+            try:
+                os.replace(os.path.join(drop_dir, name), claimed)
+            except FileNotFoundError:
+                continue
+            # Nama di processed/ diberi awalan waktu: unik dan urut sesuai waktu diterima
+            target = f'{time.time_ns():020d}-{name}'
+            try:
+                added += self.ingest(pd.read_csv(claimed, dtype=SCHEMA))
+                self._applied.add(target)
+                target_dir = 'processed'
+            except ValueError as error:
+                logger.warning('%s ditolak: %s', name, error)
+                target_dir = 'rejected'
+            os.makedirs(os.path.join(drop_dir, target_dir), exist_ok=True)
+            os.replace(claimed, os.path.join(drop_dir, target_dir, target))
+        return added
+
+    def _replay_processed(self, drop_dir):
+        processed_dir = os.path.join(drop_dir, 'processed')
+        if not os.path.isdir(processed_dir):
+            return 0
+        names = sorted(entry.name for entry in os.scandir(processed_dir)
+                       if entry.is_file() and entry.name not in self._applied)
+        added = 0
+        for name in names:
+            try:
+                added += self.ingest(pd.read_csv(os.path.join(processed_dir, name), dtype=SCHEMA))
+            except ValueError as error:
+                logger.warning('%s di processed/ tidak bisa diterapkan: %s', name, error)
+            self._applied.add(name)
+        return added
+
+    def rows(self, data):
+        # Baris dasar `data` ditambah baris dari batch yang sudah di-ingest
+        # (hanya kolom yang ada di `data`), di-cache sampai ingest berikutnya
+        if not self.deltas:
+            return data
+        key = tuple(data.columns)
+        if key not in self._rows:
+            self._rows[key] = concat_frames([data] + [delta[list(data.columns)] for delta in self.deltas])
+        return self._rows[key]
+
+    def profile(self, data):
+        # Profil self.rows(data): profil data dasar (get_profile, disimpan per
+        # versi file dasar) digabung dengan profil baris batch yang belum
+        # diprofilkan, jadi setiap batch hanya dipindai sekali per set kolom
+        rows = self.rows(data)
+        key = tuple(data.columns)
+        covered, profile = self._profiles.get(key, (0, None))
+        if profile is None:
+            covered, profile = len(data), get_profile(data, self.base_version)
+        if covered < len(rows):
+            profile = profile.merge(build_profile(rows.iloc[covered:]))
+            covered = len(rows)
+        with self._lock:
+            if covered >= self._profiles.get(key, (0, None))[0]:
+                self._profiles[key] = (covered, profile)
+        return profile
+
+
+@st.cache_resource(show_spinner='Menyiapkan data...', max_entries=2)
+def _get_store(path, version):
+    data, _ = load_data(path, columns=STORE_COLUMNS)
+    return SalesStore.from_data(data, version)
+
+
+def get_store(path):
+    # Satu store per versi file dasar, dipakai bersama oleh semua session
+    return _get_store(path, data_version(path))
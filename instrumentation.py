@@ -0,0 +1,200 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Instrumentasi ringan per tahap (load CSV, parsing tanggal, groupby, render
+# grafik, serialisasi st.pyplot, ...): durasi, selisih RSS, dan jumlah baris.
+# Setiap tahap dicatat ke daftar per thread (untuk panel Performance satu
+# rerun), ke total per proses (format teks Prometheus), dan opsional ke log
+# JSON lines.
+#
+#   SALES_METRICS_LOG=metrics.jsonl   tambahkan satu baris JSON per tahap
+#   SALES_METRICS_PORT=9100           sajikan GET /metrics dari proses app
+#   SALES_METRICS_HOST=0.0.0.0        alamat bind /metrics (default hanya localhost)
+#   SALES_METRICS_WORKER=2            indeks worker; /metrics di port SALES_METRICS_PORT + indeks
+
+LOG_ENV = 'SALES_METRICS_LOG'
+PORT_ENV = 'SALES_METRICS_PORT'
+HOST_ENV = 'SALES_METRICS_HOST'
+WORKER_ENV = 'SALES_METRICS_WORKER'
+DEFAULT_HOST = '127.0.0.1'
+METRIC_PREFIX = 'sales_stage'
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+_totals = {}
+_lock = threading.Lock()
+
+
+def current_rss_bytes():
+    # RSS saat ini dari /proc (Linux); selain itu pakai peak RSS
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
+
+
+def begin_run():
+    # Dipanggil di awal setiap rerun; catatan rerun sebelumnya di thread ini dibuang
+    _local.records = []
+    _local.depth = 0
+
+
+def run_records():
+    return list(getattr(_local, 'records', []))
+
+
+def _write_log(record):
+    path = os.environ.get(LOG_ENV)
+    if path:
+        with _lock, open(path, 'a') as file:
+            file.write(json.dumps(record) + '\n')
+
+
+@contextmanager
+def stage(name, rows=None):
+    # `rows` bisa diisi sesudah tahap berjalan: with stage('x') as info: info['rows'] = n
+    info = {'rows': rows}
+    depth = getattr(_local, 'depth', 0)
+    _local.depth = depth + 1
+    rss = current_rss_bytes()
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        yield info
+    finally:
+        record = {
+            'stage': name,
+            'seconds': time.perf_counter() - start,
+            'memory_delta_bytes': current_rss_bytes() - rss,
+            'rows': info['rows'],
+            'depth': depth,
+            'timestamp': started,
+        }
+        _local.depth = depth
+        if not hasattr(_local, 'records'):
+            _local.records = []
+        _local.records.append(record)
+        with _lock:
+            totals = _totals.setdefault(name, {'calls': 0, 'seconds': 0.0, 'rows': 0, 'memory_delta_bytes': 0})
+            totals['calls'] += 1
+            totals['seconds'] += record['seconds']
+            totals['rows'] += record['rows'] or 0
+            totals['memory_delta_bytes'] += record['memory_delta_bytes']
+        _write_log(record)
+
+
+def timed(name=None, rows=None):
+    # Decorator; `rows` opsional berupa fungsi (hasil) -> jumlah baris
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name or function.__qualname__) as info:
+                result = function(*args, **kwargs)
+                if rows is not None:
+                    info['rows'] = rows(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def totals():
+    with _lock:
+        return {name: dict(values) for name, values in _totals.items()}
+
+
+def prometheus_text():
+    lines = []
+    # Selisih RSS bisa negatif (memori dibebaskan), jadi dilaporkan sebagai gauge
+    metrics = [
+        ('calls', 'calls_total', 'counter', 'Jumlah eksekusi tahap'),
+        ('seconds', 'seconds_total', 'counter', 'Total durasi tahap dalam detik'),
+        ('rows', 'rows_total', 'counter', 'Total baris yang diproses tahap'),
+        ('memory_delta_bytes', 'memory_delta_bytes', 'gauge', 'Jumlah selisih RSS selama tahap'),
+    ]
+    snapshot = totals()
+    for field, suffix, kind, description in metrics:
+        metric = f'{METRIC_PREFIX}_{suffix}'
+        lines += [f'# HELP {metric} {description}', f'# TYPE {metric} {kind}']
+        lines += [f'{metric}{{stage="{name}"}} {values[field]}' for name, values in sorted(snapshot.items())]
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != '/metrics':
+            self.send_error(404)
+            return
+        body = prometheus_text().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_attempted = False
+
+
+def metrics_port(port=None, worker=None):
+    # Port yang bisa ditebak per worker: port dasar + indeks worker (default 0),
+    # jadi setiap proses bisa didaftarkan sebagai target scrape Prometheus
+    port = port or os.environ.get(PORT_ENV)
+    if not port:
+        return None
+    worker = worker if worker is not None else os.environ.get(WORKER_ENV, 0)
+    return int(port) + int(worker)
+
+
+def start_metrics_server(port=None, host=None, worker=None):
+    # Satu server /metrics per proses (daemon thread). Bind hanya dicoba sekali
+    # per proses, bukan setiap rerun; bila port sudah dipakai (mis. dua worker
+    # dengan SALES_METRICS_WORKER yang sama) error dicatat dan /metrics tidak
+    # aktif, bukan pindah ke port acak yang tidak bisa di-scrape
+    global _server, _server_attempted
+    port = metrics_port(port, worker)
+    if port is None:
+        return None
+    with _lock:
+        if not _server_attempted:
+            _server_attempted = True
+            host = host or os.environ.get(HOST_ENV, DEFAULT_HOST)
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as error:
+                logger.error('server /metrics gagal bind ke %s:%d (%s); set %s berbeda untuk setiap worker',
+                             host, port, error, WORKER_ENV)
+                return None
+            logger.info('server /metrics di %s:%d', host, port)
+            threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+    return _server
+
+
+def render_performance_panel():
+    # Panel sidebar opsional: tahap-tahap pada rerun ini (bertingkat sesuai nesting)
+    import streamlit as st
+
+    if not st.sidebar.checkbox('Performance', value=False):
+        return
+    records = sorted(run_records(), key=lambda record: record['timestamp'])
+    rows = [{
+        'Stage': '· ' * record['depth'] + record['stage'],
+        'ms': round(record['seconds'] * 1000, 1),
+        'RSS Δ MB': round(record['memory_delta_bytes'] / 1024 ** 2, 1),
+        'Rows': record['rows'],
+    } for record in records]
+    st.sidebar.dataframe(rows, hide_index=True)
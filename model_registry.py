@@ -0,0 +1,111 @@
+import hashlib
+import os
+import pickle
+import time
+
+import numpy as np
+import streamlit as st
+
+# Versi model yang tersedia: nama -> path artefak.
+# linear_regression_model.pkl berisi Ridge(alpha=100) hasil hyperparameter
+# tuning pada indeks minggu (lihat bagian "Hyperparamter Tunning").
+MODEL_VERSIONS = {
+    'ridge': 'linear_regression_model.pkl',
+}
+DEFAULT_MODEL = 'ridge'
+
+# Global yang boleh dibuat saat unpickle artefak: tepat kelas estimator yang
+# dikirim bersama app (tambahkan di sini bila mendaftarkan model jenis lain)
+# dan konstruktor array NumPy. Kelas harus benar-benar didefinisikan di modul
+# yang tertulis di pickle, jadi re-export dari modul lain (mis. attrgetter di
+# sklearn.feature_selection._base) ditolak, begitu pula os.system, eval, dll.
+_ALLOWED_CLASSES = {
+    ('sklearn.linear_model._ridge', 'Ridge'),
+    ('sklearn.linear_model._base', 'LinearRegression'),
+}
+_ALLOWED_GLOBALS = {
+    ('numpy', 'ndarray'),
+    ('numpy', 'dtype'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+    ('numpy.core.numeric', '_frombuffer'),
+    ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy._core.multiarray', 'scalar'),
+    ('numpy._core.numeric', '_frombuffer'),
+    ('_codecs', 'encode'),  # byte array NumPy pada pickle protokol 2
+    ('joblib.numpy_pickle', 'NumpyArrayWrapper'),
+}
+
+# Cache hash file per (path, mtime, size) agar file tidak di-hash ulang setiap rerun
+_digests = {}
+
+
+class _AllowlistMixin:
+    def find_class(self, module, name):
+        if (module, name) in _ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        if (module, name) in _ALLOWED_CLASSES or module == 'numpy.dtypes':
+            obj = super().find_class(module, name)
+            if isinstance(obj, type) and obj.__module__ == module and (module != 'numpy.dtypes'
+                                                                       or issubclass(obj, np.dtype)):
+                return obj
+        raise pickle.UnpicklingError(f'global {module}.{name} tidak diizinkan di artefak model')
+
+
+class _RestrictedUnpickler(_AllowlistMixin, pickle.Unpickler):
+    pass
+
+
+def _load_joblib(path):
+    # Seperti joblib.load(path, mmap_mode='r') (array besar tidak disalin ke
+    # RAM), tetapi lewat NumpyUnpickler dengan allowlist yang sama
+    from joblib import numpy_pickle
+
+    class _RestrictedNumpyUnpickler(_AllowlistMixin, numpy_pickle.NumpyUnpickler):
+        pass
+
+    with open(path, 'rb') as file:
+        with numpy_pickle._validate_fileobject_and_memmap(file, path, 'r') as (fobj, mmap_mode):
+            if isinstance(fobj, str):
+                raise pickle.UnpicklingError(f'format joblib lama tidak didukung: {path}')
+            return _RestrictedNumpyUnpickler(path, fobj, ensure_native_byte_order=False, mmap_mode=mmap_mode).load()
+
+
+def register_model(name, path):
+    MODEL_VERSIONS[name] = path
+
+
+def file_digest(path):
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if key not in _digests:
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                sha256.update(block)
+        _digests[key] = sha256.hexdigest()
+    return _digests[key]
+
+
+def load_artifact(path):
+    # .joblib dibaca dengan memory map (array besar tidak disalin ke RAM);
+    # keduanya lewat unpickler yang membatasi global yang boleh dibuat
+    if path.endswith('.joblib'):
+        return _load_joblib(path)
+    with open(path, 'rb') as file:
+        return _RestrictedUnpickler(file).load()
+
+
+@st.cache_resource(show_spinner='Memuat model...')
+def _load_model(path, digest):
+    start = time.perf_counter()
+    model = load_artifact(path)
+    info = {'path': path, 'sha256': digest, 'load_seconds': time.perf_counter() - start}
+    return model, info
+
+
+def get_model(name=DEFAULT_MODEL):
+    # Model dimuat saat pertama kali dibutuhkan, lalu satu instance dipakai
+    # bersama oleh semua session di proses ini (kunci: hash isi file)
+    path = MODEL_VERSIONS[name]
+    return _load_model(path, file_digest(path))
@@ -0,0 +1,208 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+from data_loader import DATA_URL, SCHEMA_VERSION, read_csv
+from forecasting import daily_sales, forecast, weekly_sales
+from instrumentation import stage
+from model_registry import DEFAULT_MODEL, MODEL_VERSIONS, file_digest, load_artifact
+
+# Pipeline artefak turunan CSV sebagai DAG kecil: setiap tahap punya input
+# (tahap lain atau file sumber) dan parameter. Kunci cache sebuah tahap adalah
+# fingerprint dari nama, parameter, dan fingerprint semua inputnya; file
+# sumber di-fingerprint dari isinya (sha256). Hasil disimpan sebagai pickle di
+# .cache/pipeline dengan eviksi LRU berdasarkan ukuran, jadi perubahan CSV
+# atau file model hanya menghitung ulang tahap di hilirnya. Konsumennya
+# service.py dan CLI ini; app.py tetap memakai cache Streamlit sendiri.
+#
+#   python pipeline.py [--target forecast] [--weeks 12] [--csv path] [--model ridge] [--max-mb 256]
+
+CACHE_DIR = os.path.join('.cache', 'pipeline')
+CACHE_MAX_MB = 256
+
+# Dinaikkan bila kode salah satu tahap berubah, supaya artefak lama tidak dipakai
+PIPELINE_VERSION = 1
+
+
+class Stage:
+
+    def __init__(self, name, function, inputs=(), sources=(), params=None, version=0):
+        # `version` ikut masuk fingerprint (mis. versi skema data)
+        self.name = name
+        self.version = version
+        self.function = function
+        self.inputs = tuple(inputs)
+        self.sources = tuple(sources)
+        self.params = params or {}
+
+
+def _read_data(csv):
+    return read_csv(csv)
+
+
+def _forecast(weekly_sales, model, weeks):
+    return forecast(load_artifact(model), weekly_sales, weeks)
+
+
+# Fungsi tahap dipanggil dengan (nilai input..., path sumber..., **params)
+STAGES = {definition.name: definition for definition in [
+    Stage('data', _read_data, sources=['csv'], version=SCHEMA_VERSION),
+    Stage('daily_sales', daily_sales, inputs=['data']),
+    Stage('weekly_sales', weekly_sales, inputs=['daily_sales']),
+    Stage('forecast', _forecast, inputs=['weekly_sales'], sources=['model'], params={'weeks': 12}),
+]}
+
+
+def digest(*parts):
+    sha256 = hashlib.sha256()
+    for part in parts:
+        sha256.update(json.dumps(part, sort_keys=True).encode())
+    return sha256.hexdigest()[:16]
+
+
+class DiskCache:
+    # Pickle per fingerprint; mtime file diperbarui setiap hit sehingga eviksi
+    # membuang artefak yang paling lama tidak dipakai sampai total ukuran di bawah batas
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_MB * 1024 ** 2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            value = pd.read_pickle(path)
+        except FileNotFoundError:
+            return None, False
+        os.utime(path)
+        return value, True
+
+    def put(self, key, value):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        pd.to_pickle(value, path + '.tmp')
+        os.replace(path + '.tmp', path)
+        self.evict(keep=path)
+
+    def entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self, keep=None):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                os.remove(path)
+                total -= size
+        return total
+
+
+class Pipeline:
+    # Satu eksekusi: fingerprint dihitung dari atas ke bawah tanpa memuat nilai,
+    # lalu hanya tahap yang dibutuhkan target (dan belum ada di cache) yang dijalankan
+
+    def __init__(self, sources, params=None, cache=None, stages=STAGES):
+        self.sources = sources
+        self.params = params or {}
+        self.cache = cache or DiskCache()
+        self.stages = stages
+        self.fingerprints = {}
+        self.values = {}
+        self.report = {}
+
+    def stage_params(self, name):
+        return {**self.stages[name].params, **self.params.get(name, {})}
+
+    def fingerprint(self, name):
+        if name not in self.fingerprints:
+            stage_def = self.stages[name]
+            self.fingerprints[name] = digest(
+                PIPELINE_VERSION, name, stage_def.version, self.stage_params(name),
+                [self.fingerprint(dependency) for dependency in stage_def.inputs],
+                [file_digest(self.sources[source]) for source in stage_def.sources],
+            )
+        return self.fingerprints[name]
+
+    def value(self, name):
+        if name in self.values:
+            return self.values[name]
+        stage_def = self.stages[name]
+        key = self.fingerprint(name)
+        start = time.perf_counter()
+        value, hit = self.cache.get(key)
+        if not hit:
+            inputs = [self.value(dependency) for dependency in stage_def.inputs]
+            start = time.perf_counter()
+            with stage(f'pipeline.{name}'):
+                value = stage_def.function(*inputs, *(self.sources[source] for source in stage_def.sources),
+                                           **self.stage_params(name))
+            self.cache.put(key, value)
+        self.report[name] = {'status': 'hit' if hit else 'miss', 'seconds': time.perf_counter() - start,
+                             'fingerprint': key}
+        self.values[name] = value
+        return value
+
+    def closure(self, targets):
+        # Tahap target beserta semua leluhurnya, dalam urutan topologis
+        order = []
+
+        def visit(name):
+            if name not in order:
+                for dependency in self.stages[name].inputs:
+                    visit(dependency)
+                order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def run(self, targets):
+        return {target: self.value(target) for target in targets}
+
+
+def run_pipeline(targets, csv=DATA_URL, model=DEFAULT_MODEL, params=None, cache=None):
+    pipeline = Pipeline({'csv': csv, 'model': MODEL_VERSIONS[model]}, params, cache)
+    return pipeline.run(targets), pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Jalankan pipeline artefak dengan cache berbasis fingerprint')
+    parser.add_argument('--target', action='append', choices=list(STAGES),
+                        help='tahap yang dihitung (boleh berulang; default: semua tahap ujung)')
+    parser.add_argument('--csv', default=DATA_URL)
+    parser.add_argument('--model', default=DEFAULT_MODEL, choices=list(MODEL_VERSIONS))
+    parser.add_argument('--weeks', type=int, default=STAGES['forecast'].params['weeks'])
+    parser.add_argument('--max-mb', type=float, default=CACHE_MAX_MB, help='batas ukuran cache di disk')
+    args = parser.parse_args()
+
+    inputs = {dependency for stage_def in STAGES.values() for dependency in stage_def.inputs}
+    targets = args.target or [name for name in STAGES if name not in inputs]
+    cache = DiskCache(max_bytes=args.max_mb * 1024 ** 2)
+    start = time.perf_counter()
+    _, pipeline = run_pipeline(targets, args.csv, args.model, {'forecast': {'weeks': args.weeks}}, cache)
+    elapsed = time.perf_counter() - start
+
+    print(f'{"tahap":<18} {"status":<8} {"ms":>9}  fingerprint')
+    for name in pipeline.closure(targets):
+        # Tahap hulu dari artefak yang hit tidak perlu dimuat sama sekali
+        entry = pipeline.report.get(name, {'status': 'unused', 'seconds': 0.0})
+        print(f'{name:<18} {entry["status"]:<8} {entry["seconds"] * 1000:9.1f}  {pipeline.fingerprint(name)}')
+    print(f'total {elapsed * 1000:.1f} ms, cache {cache.evict() / 1024 ** 2:.1f} MB di {cache.directory}')
+
+
+if __name__ == '__main__':
+    main()
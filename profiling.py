@@ -0,0 +1,330 @@
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from instrumentation import stage
+
+# Profil data satu kali jalan dengan sketch yang bisa digabung antar chunk:
+# - t-digest untuk kuantil (describe dan boxplot),
+# - HyperLogLog untuk jumlah nilai unik,
+# - hash set (hash 64-bit yang diurutkan) untuk cek duplikat Invoice ID.
+# Statistik lain (count, null, mean, std, min, max, frekuensi kategori) dihitung
+# eksak dari jumlah berjalan. Hasilnya disimpan per versi data di CACHE_DIR.
+
+CACHE_DIR = os.path.join('.cache', 'profile')
+
+# Naikkan bila struktur DataProfile berubah, supaya pickle lama tidak dipakai
+PROFILE_VERSION = 2
+
+# Batas error default: galat relatif jumlah unik HyperLogLog (standar error
+# 1.04 / sqrt(2^p)), dan compression t-digest (makin besar makin akurat, jumlah
+# centroid sekitar compression / 2)
+HLL_ERROR = 0.01
+TDIGEST_COMPRESSION = 200
+
+CHUNK_ROWS = 500_000
+ID_COLUMN = 'Invoice ID'
+
+# Kuantil per grup untuk boxplot: kolom nilai -> kolom grup
+GROUPED_QUANTILES = {'Total': ['Gender', 'Payment']}
+
+DESCRIBE_ROWS = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def hash_values(values):
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy()
+
+
+class TDigest:
+    # Merging t-digest dengan fungsi skala k1; centroid disimpan terurut
+
+    def __init__(self, compression=TDIGEST_COMPRESSION, means=None, weights=None, min=np.inf, max=-np.inf):
+        self.compression = compression
+        self.means = np.empty(0) if means is None else means
+        self.weights = np.empty(0) if weights is None else weights
+        self.min, self.max = min, max
+
+    @property
+    def count(self):
+        return self.weights.sum()
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min, self.max = min(self.min, values.min()), max(self.max, values.max())
+        self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other):
+        merged = TDigest(self.compression, min=min(self.min, other.min), max=max(self.max, other.max))
+        if len(self.means) + len(other.means) == 0:
+            return merged
+        merged._compress(np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights]))
+        return merged
+
+    def _compress(self, means, weights):
+        # Centroid yang jatuh pada satu satuan k (skala k1) digabung menjadi satu,
+        # sehingga centroid di ekor distribusi tetap kecil
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        quantiles = (cumulative - weights / 2) / cumulative[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * quantiles - 1)
+        starts = np.flatnonzero(np.diff(np.floor(k), prepend=-np.inf))
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def quantile(self, q):
+        if len(self.means) == 0:
+            return np.full(np.shape(q), np.nan)
+        positions = np.cumsum(self.weights) - self.weights / 2
+        return np.interp(np.asarray(q) * self.count, np.concatenate([[0], positions, [self.count]]),
+                         np.concatenate([[self.min], self.means, [self.max]]))
+
+
+class HyperLogLog:
+
+    def __init__(self, error=HLL_ERROR, registers=None):
+        # Presisi p dipilih supaya standar error 1.04 / sqrt(2^p) <= error
+        if registers is None:
+            registers = np.zeros(1 << int(np.clip(np.ceil(np.log2((1.04 / error) ** 2)), 4, 18)), dtype='uint8')
+        self.registers = registers
+        self.precision = len(registers).bit_length() - 1
+
+    def update(self, values):
+        hashes = hash_values(values)
+        index = (hashes >> np.uint64(64 - self.precision)).astype('int64')
+        rest = (hashes << np.uint64(self.precision)) | np.uint64(1 << (self.precision - 1))
+        # Posisi bit 1 pertama (dari kiri) pada sisa hash
+        rank = (64 - np.floor(np.log2(rest.astype('float64')))).astype('uint8')
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        return HyperLogLog(registers=np.maximum(self.registers, other.registers))
+
+    @property
+    def error(self):
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype('float64')))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * m and zeros:
+            # Koreksi rentang kecil (linear counting)
+            return m * np.log(m / zeros)
+        return raw
+
+
+class HashSet:
+    # Hash 64-bit unik yang terurut; duplikat = jumlah nilai dikurangi jumlah hash
+    # unik. Hash per chunk ditampung dulu lalu diurutkan dengan satu np.unique
+    # saat dibutuhkan, bukan union1d per chunk (yang mengurutkan ulang semuanya)
+
+    def __init__(self, hashes=None, count=None):
+        self._hashes = np.empty(0, dtype='uint64') if hashes is None else hashes
+        self._pending = []
+        self.count = len(self._hashes) if count is None else count
+
+    def update(self, values):
+        hashes = hash_values(values)
+        self._pending.append(hashes)
+        self.count += len(hashes)
+        return self
+
+    def compact(self):
+        if self._pending:
+            self._hashes, self._pending = np.unique(np.concatenate([self._hashes, *self._pending])), []
+        return self
+
+    @property
+    def hashes(self):
+        return self.compact()._hashes
+
+    @property
+    def duplicates(self):
+        return self.count - len(self.hashes)
+
+    def merge(self, other):
+        return HashSet(np.union1d(self.hashes, other.hashes), self.count + other.count)
+
+
+class ColumnProfile:
+    # Statistik satu kolom; numerik (termasuk tanggal sebagai int64 ns) atau kategori
+
+    def __init__(self, kind, hll_error=HLL_ERROR, compression=TDIGEST_COMPRESSION):
+        self.kind = kind
+        self.count = 0
+        self.nulls = 0
+        self.unique = HyperLogLog(hll_error)
+        self.frequencies = pd.Series(dtype='int64')
+        self.total = 0.0
+        self.m2 = 0.0
+        self.digest = TDigest(compression)
+
+    def update(self, values):
+        nulls = int(values.isna().sum())
+        values = values.dropna()
+        self.nulls += nulls
+        self.unique.update(values)
+        if self.kind == 'category':
+            self.frequencies = self.frequencies.add(values.astype(str).value_counts(), fill_value=0).astype('int64')
+        elif self.kind != 'text':
+            numbers = values.to_numpy()
+            if self.kind == 'datetime':
+                numbers = numbers.astype('datetime64[ns]').astype('int64')
+            numbers = numbers.astype('float64')
+            self._update_moments(len(numbers), numbers.sum(), ((numbers - numbers.mean()) ** 2).sum() if len(numbers) else 0.0)
+            self.digest.update(numbers)
+        self.count += len(values)
+        return self
+
+    def _update_moments(self, count, total, m2):
+        # Penggabungan varians berjalan (Chan et al.)
+        if count == 0:
+            return
+        if self.count:
+            delta = total / count - self.total / self.count
+            self.m2 += m2 + delta ** 2 * self.count * count / (self.count + count)
+        else:
+            self.m2 = m2
+        self.total += total
+
+    def merge(self, other):
+        merged = ColumnProfile(self.kind)
+        merged.nulls = self.nulls + other.nulls
+        merged.unique = self.unique.merge(other.unique)
+        merged.frequencies = self.frequencies.add(other.frequencies, fill_value=0).astype('int64')
+        merged.digest = self.digest.merge(other.digest)
+        merged.count, merged.total, merged.m2 = self.count, self.total, self.m2
+        merged._update_moments(other.count, other.total, other.m2)
+        merged.count += other.count
+        return merged
+
+    def describe(self):
+        stats = {'count': self.count}
+        if self.kind in ('category', 'text'):
+            stats['unique'] = round(self.unique.estimate()) if self.kind == 'text' else len(self.frequencies)
+            if len(self.frequencies):
+                stats['top'], stats['freq'] = self.frequencies.idxmax(), self.frequencies.max()
+            return stats
+
+        quantiles = self.digest.quantile([0.25, 0.5, 0.75])
+        values = [self.total / self.count if self.count else np.nan, self.digest.min, *quantiles, self.digest.max]
+        if self.kind == 'datetime':
+            stats.update(zip(['mean', 'min', '25%', '50%', '75%', 'max'], pd.to_datetime(np.asarray(values, dtype='int64'))))
+        else:
+            stats.update(zip(['mean', 'min', '25%', '50%', '75%', 'max'], values))
+            stats['std'] = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        return stats
+
+
+def column_kind(dtype):
+    if isinstance(dtype, pd.CategoricalDtype):
+        return 'category'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'datetime'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    return 'text'
+
+
+class DataProfile:
+
+    def __init__(self, dtypes, hll_error=HLL_ERROR, compression=TDIGEST_COMPRESSION):
+        self.columns = {column: ColumnProfile(column_kind(dtype), hll_error, compression)
+                        for column, dtype in dtypes.items()}
+        self.ids = HashSet()
+        self.groups = {(value, group): {} for value, groups in GROUPED_QUANTILES.items() for group in groups
+                       if value in dtypes and group in dtypes}
+        self.compression = compression
+        self.rows = 0
+
+    def update(self, chunk):
+        for column, profile in self.columns.items():
+            profile.update(chunk[column])
+        if ID_COLUMN in chunk:
+            self.ids.update(chunk[ID_COLUMN])
+        for (value, group), digests in self.groups.items():
+            for key, values in chunk.groupby(group, observed=True)[value]:
+                digests.setdefault(key, TDigest(self.compression)).update(values.to_numpy())
+        self.rows += len(chunk)
+        return self
+
+    def merge(self, other):
+        merged = DataProfile({}, compression=self.compression)
+        merged.columns = {column: profile.merge(other.columns[column]) for column, profile in self.columns.items()}
+        merged.ids = self.ids.merge(other.ids)
+        for key, digests in self.groups.items():
+            merged.groups[key] = dict(digests)
+            for group, digest in other.groups.get(key, {}).items():
+                merged.groups[key][group] = digests[group].merge(digest) if group in digests else digest
+        merged.rows = self.rows + other.rows
+        return merged
+
+    @property
+    def duplicates(self):
+        return self.ids.duplicates
+
+    def null_counts(self):
+        return pd.Series({column: profile.nulls for column, profile in self.columns.items()}, dtype='int64')
+
+    def describe(self):
+        # Bentuk sama dengan data.describe(include='all')
+        table = pd.DataFrame({column: profile.describe() for column, profile in self.columns.items()})
+        return table.reindex([row for row in DESCRIBE_ROWS if row in table.index])
+
+    def box_stats(self, value, group):
+        # Statistik boxplot (format Axes.bxp) per grup; whisker 1.5 IQR dibatasi min/max
+        stats = []
+        for key, digest in sorted(self.groups[(value, group)].items(), key=lambda item: str(item[0])):
+            q1, median, q3 = digest.quantile([0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            stats.append({'label': str(key), 'q1': q1, 'med': median, 'q3': q3, 'fliers': [],
+                          'whislo': max(digest.min, q1 - 1.5 * iqr), 'whishi': min(digest.max, q3 + 1.5 * iqr)})
+        return stats
+
+
+def build_profile(data, chunk_rows=CHUNK_ROWS, hll_error=HLL_ERROR, compression=TDIGEST_COMPRESSION):
+    profile = DataProfile(data.dtypes, hll_error, compression)
+    with stage('profile_build', rows=len(data)):
+        for start in range(0, len(data), chunk_rows):
+            profile.update(data.iloc[start:start + chunk_rows])
+        # Profil dipakai bersama antar session, jadi tidak ada lagi hash yang tertunda
+        profile.ids.compact()
+    return profile
+
+
+def profile_path(version, hll_error=HLL_ERROR, compression=TDIGEST_COMPRESSION):
+    return os.path.join(CACHE_DIR, f'{version}-{hll_error}-{compression}-v{PROFILE_VERSION}.pkl')
+
+
+def _remove_stale_profiles(keep):
+    # Hanya profil versi terbaru yang disimpan di disk
+    for entry in os.scandir(CACHE_DIR):
+        if entry.name.endswith('.pkl') and entry.path != keep:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+@st.cache_resource(show_spinner='Menghitung profil data...', max_entries=2)
+def get_profile(_data, version, hll_error=HLL_ERROR, compression=TDIGEST_COMPRESSION):
+    # Profil disimpan per versi data (dan batas error), jadi proses baru
+    # tidak perlu memindai ulang data yang sama
+    path = profile_path(version, hll_error, compression)
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+    profile = build_profile(_data, hll_error=hll_error, compression=compression)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    pd.to_pickle(profile, path + '.tmp')
+    os.replace(path + '.tmp', path)
+    _remove_stale_profiles(path)
+    return profile
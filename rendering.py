@@ -0,0 +1,58 @@
+import io
+import os
+from contextlib import contextmanager
+
+import streamlit as st
+
+from instrumentation import current_rss_bytes, stage
+
+# Backend non-interaktif lewat environment (bukan matplotlib.use), supaya
+# matplotlib tidak ikut diimpor oleh modul yang hanya butuh memory gauge;
+# berlaku saat pyplot/seaborn pertama kali diimpor
+os.environ['MPLBACKEND'] = 'Agg'
+
+# Semua figure dibuat lewat matplotlib.figure.Figure, bukan plt.subplots(),
+# sehingga tidak pernah terdaftar di registry global pyplot dan dibebaskan
+# oleh garbage collector setelah tidak dipakai.
+
+
+def new_figure(figsize=None):
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=figsize)
+
+
+def figure_png(fig, dpi=200):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+@contextmanager
+def session_figure(key, figsize=None):
+    # Figure dipakai ulang per session dan per `key` (satu figure per posisi
+    # grafik di halaman); isinya dibersihkan setelah ditampilkan
+    pool = st.session_state.setdefault('_figure_pool', {})
+    fig = pool.get(key)
+    if fig is None:
+        fig = pool[key] = new_figure(figsize)
+    elif figsize is not None:
+        fig.set_size_inches(figsize)
+    st.session_state['figures_rendered'] = st.session_state.get('figures_rendered', 0) + 1
+    try:
+        with stage(f'figure.{key}'):
+            yield fig, fig.subplots()
+    finally:
+        fig.clear()
+
+
+def show_figure(fig):
+    # st.pyplot dengan pencatatan waktu serialisasi figure
+    with stage('st_pyplot'):
+        st.pyplot(fig)
+
+
+def render_memory_gauge():
+    pool = st.session_state.get('_figure_pool', {})
+    st.sidebar.caption(f"Figure: {st.session_state.get('figures_rendered', 0):,} dirender, "
+                       f"{len(pool)} di pool session · RSS: {current_rss_bytes() / 1024 ** 2:.0f} MB")
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from instrumentation import timed
+
+# Grain rollup: satu baris per kombinasi tanggal, cabang, kota, dan garis produk
+ROLLUP_KEYS = ['Date', 'Branch', 'City', 'Product line']
+
+# Histogram rating dengan lebar bin 0.5 pada skala 0-10
+RATING_BINS = np.linspace(0, 10, 21)
+RATING_COLUMNS = [f'rating_{i}' for i in range(len(RATING_BINS) - 1)]
+
+
+def rating_bin(rating):
+    # Indeks bin 0..n-1; rating 10 masuk ke bin terakhir
+    return np.clip(np.searchsorted(RATING_BINS, rating, side='right') - 1, 0, len(RATING_COLUMNS) - 1)
+
+
+@timed('build_rollup', rows=len)
+def build_rollup(data):
+    sums = data.groupby(ROLLUP_KEYS, observed=True).agg(Total=('Total', 'sum'), Quantity=('Quantity', 'sum'))
+
+    bins = pd.Series(rating_bin(data['Rating'].to_numpy()), index=data.index, name='rating_bin')
+    histogram = data[ROLLUP_KEYS].assign(rating_bin=bins).groupby(ROLLUP_KEYS + ['rating_bin'], observed=True).size()
+    histogram = histogram.unstack(fill_value=0).reindex(columns=range(len(RATING_COLUMNS)), fill_value=0)
+    histogram.columns = RATING_COLUMNS
+
+    rollup = sums.join(histogram).reset_index()
+    return rollup.sort_values('Date', kind='stable', ignore_index=True)
+
+
+@timed('groupby', rows=len)
+def sales_by(rollup, key):
+    # Total penjualan per `key`; hanya kategori yang muncul pada data terfilter
+    sales = rollup.groupby(key, observed=True)['Total'].sum().reset_index()
+    if isinstance(sales[key].dtype, pd.CategoricalDtype):
+        sales[key] = sales[key].astype(str)
+    return sales
+
+
+def rating_histogram(rollup):
+    # Jumlah rating per bin, tanpa bin kosong di kedua ujung
+    counts = rollup[RATING_COLUMNS].sum().to_numpy()
+    nonzero = np.flatnonzero(counts)
+    if len(nonzero) == 0:
+        return RATING_BINS[:1], counts[:0]
+    lo, hi = nonzero[0], nonzero[-1] + 1
+    return RATING_BINS[lo:hi + 1], counts[lo:hi]
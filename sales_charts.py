@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import seaborn as sns
+import streamlit as st
+
+from data_loader import add_time_features
+from downsample import downsample, figure_width_px, point_budget
+from heatmap import hour_date_matrix, plot_heatmap
+from instrumentation import stage
+from rendering import figure_png, new_figure
+
+# Grafik halaman Sales Analysis dirender sekali per versi data di background
+# thread, disimpan sebagai PNG, lalu halaman cukup menampilkan bytes-nya.
+# Figure dibuat lewat rendering.new_figure (bukan pyplot) sehingga aman
+# dipakai di luar main thread dan tidak tertinggal di registry pyplot.
+
+DPI = 200
+
+
+def _sum_by(data, keys):
+    # Agregasi dulu dengan groupby, daripada seaborn memindai baris mentah (estimator=sum)
+    return data.groupby(keys, observed=True)['Total'].sum().reset_index()
+
+
+def branch_city(data, ax):
+    sns.barplot(data=_sum_by(data, ['Branch', 'City']), x='Branch', y='Total', hue='City', errorbar=None, ax=ax)
+
+
+def customer_type(data, ax):
+    sns.barplot(data=_sum_by(data, ['Customer type']), x='Customer type', y='Total', errorbar=None, ax=ax)
+
+
+def _box_from_profile(profile, group, ax):
+    # Boxplot dari kuantil t-digest per grup, tanpa memindai baris mentah
+    stats = profile.box_stats('Total', group)
+    ax.bxp(stats, showfliers=False, patch_artist=True,
+           boxprops={'facecolor': sns.color_palette()[0]}, medianprops={'color': 'black'})
+    ax.set_xlabel(group)
+    ax.set_ylabel('Total')
+
+
+def gender_box(profile, ax):
+    _box_from_profile(profile, 'Gender', ax)
+
+
+def product_line(data, ax):
+    sns.barplot(data=_sum_by(data, ['Product line']), x='Product line', y='Total', errorbar=None, ax=ax)
+
+
+def price_quantity_by_product(data, ax):
+    sns.scatterplot(data=data, x='Unit price', y='Quantity', hue='Product line', ax=ax)
+
+
+def payment_pie(data, ax):
+    data['Payment'].value_counts().plot.pie(autopct='%1.1f%%', colors=sns.color_palette("Set2"), ax=ax)
+
+
+def payment_box(profile, ax):
+    _box_from_profile(profile, 'Payment', ax)
+
+
+def daily_sales(data, ax):
+    daily = downsample(_sum_by(data, ['Date']), point_budget(figure_width_px(ax.figure, DPI)), x='Date')
+    sns.lineplot(data=daily, x='Date', y='Total', ax=ax)
+
+
+def hour_date_heatmap(data, ax):
+    hourly = add_time_features(data[['Date', 'Time', 'Total']])
+    matrix, hours, labels, freq = hour_date_matrix(hourly['Hour'], hourly['Timestamp'], hourly['Total'].to_numpy())
+    plot_heatmap(ax, matrix, hours, labels, freq)
+
+
+def price_quantity(data, ax):
+    sns.scatterplot(data=data, x='Unit price', y='Quantity', ax=ax)
+
+
+def income_margin(data, ax):
+    sns.scatterplot(data=data, x='gross income', y='gross margin percentage', hue='Product line', ax=ax)
+
+
+def rating_total(data, ax):
+    sns.scatterplot(data=data, x='Rating', y='Total', ax=ax)
+
+
+# Nama grafik -> (fungsi render, ukuran figure), sesuai urutan tampil di halaman
+CHARTS = {
+    'branch_city': (branch_city, (12, 6)),
+    'customer_type': (customer_type, (8, 6)),
+    'gender_box': (gender_box, (8, 6)),
+    'product_line': (product_line, (12, 6)),
+    'price_quantity_by_product': (price_quantity_by_product, (12, 6)),
+    'payment_pie': (payment_pie, (8, 6)),
+    'payment_box': (payment_box, (8, 6)),
+    'daily_sales': (daily_sales, (12, 6)),
+    'hour_date_heatmap': (hour_date_heatmap, (12, 6)),
+    'price_quantity': (price_quantity, (8, 6)),
+    'income_margin': (income_margin, (8, 6)),
+    'rating_total': (rating_total, (8, 6)),
+}
+
+# Grafik yang digambar dari profil sketch (profiling.DataProfile), bukan dari baris data
+PROFILE_CHARTS = {'gender_box', 'payment_box'}
+
+
+def render_chart(name, data, profile):
+    draw, figsize = CHARTS[name]
+    fig = new_figure(figsize)
+    with stage(f'chart.{name}.draw'):
+        draw(profile if name in PROFILE_CHARTS else data, fig.subplots())
+    with stage(f'chart.{name}.png'):
+        return figure_png(fig, dpi=DPI)
+
+
+class ChartJob:
+    # Merender semua grafik di satu background thread; get() menunggu grafik
+    # yang diminta saja, jadi grafik pertama bisa tampil sebelum semuanya selesai
+
+    def __init__(self, data, profile):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sales-charts')
+        self.futures = {name: self.executor.submit(render_chart, name, data, profile) for name in CHARTS}
+        self.executor.shutdown(wait=False)
+
+    def get(self, name):
+        return self.futures[name].result()
+
+
+# Versi store sekarang dan sebelumnya (session yang belum rerun); versi lama dibuang
+@st.cache_resource(show_spinner=False, max_entries=2)
+def get_chart_job(_data, version, _profile):
+    return ChartJob(_data, _profile)
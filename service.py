@@ -0,0 +1,147 @@
+import json
+import sys
+import threading
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from data_loader import DATA_URL, data_version
+from forecasting import forecast
+from instrumentation import prometheus_text
+from model_registry import DEFAULT_MODEL, MODEL_VERSIONS, file_digest, load_artifact
+from pipeline import run_pipeline
+
+# Layanan HTTP forecasting tanpa UI, untuk sistem lain (mis. replenishment):
+#
+#   uvicorn service:app --port 8000
+#   GET /forecast?model=ridge&weeks=12
+#
+# Model dan seri mingguan disimpan di memori proses; respons di-cache per
+# (hash model, horizon) dan dibuang ketika file data atau model berubah.
+
+MAX_WEEKS = 52
+
+
+def load_weekly_sales(path=DATA_URL):
+    # Seri mingguan yang sama dengan halaman Forecasting (tanpa batch dari drop
+    # directory); diambil dari cache pipeline bila isi CSV tidak berubah
+    return run_pipeline(['weekly_sales'], csv=path)[0]['weekly_sales']
+
+
+def forecast_payload(model, weekly, weeks_ahead):
+    predictions = forecast(model, weekly, weeks_ahead)['Predicted Sales']
+    return [{'date': date.strftime('%Y-%m-%d'), 'predicted_sales': float(value)} for date, value in predictions.items()]
+
+
+class ForecastService:
+
+    def __init__(self, path=DATA_URL):
+        self.path = path
+        self.version = None
+        self.weekly = None
+        self.models = {}
+        self.responses = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        # Memuat ulang seri mingguan bila file data berubah; cache respons ikut dikosongkan
+        version = data_version(self.path)
+        if version != self.version:
+            with self._lock:
+                if version != self.version:
+                    self.weekly = load_weekly_sales(self.path)
+                    self.responses = {}
+                    self.version = version
+
+    def _model(self, name):
+        path = MODEL_VERSIONS[name]
+        digest = file_digest(path)
+        if self.models.get(name, (None,))[0] != digest:
+            self.models[name] = (digest, load_artifact(path))
+        return self.models[name]
+
+    def forecast(self, name, weeks_ahead):
+        # Mengembalikan body JSON (bytes) yang sudah di-encode, supaya cache hit
+        # tidak perlu serialisasi ulang
+        self._refresh()
+        digest, model = self._model(name)
+        key = (digest, weeks_ahead)
+        body = self.responses.get(key)
+        if body is None:
+            body = json.dumps({
+                'model': name,
+                'model_sha256': digest,
+                'data_version': self.version,
+                'weeks': weeks_ahead,
+                'predictions': forecast_payload(model, self.weekly, weeks_ahead),
+            }).encode()
+            self.responses[key] = body
+        return body
+
+    def warm_up(self):
+        self._refresh()
+        for name in MODEL_VERSIONS:
+            self._model(name)
+
+
+service = ForecastService()
+
+
+async def forecast_endpoint(request):
+    name = request.query_params.get('model', DEFAULT_MODEL)
+    if name not in MODEL_VERSIONS:
+        return JSONResponse({'error': f'model tidak dikenal: {name}', 'models': list(MODEL_VERSIONS)}, status_code=404)
+    try:
+        weeks_ahead = int(request.query_params.get('weeks', 12))
+    except ValueError:
+        return JSONResponse({'error': 'weeks harus bilangan bulat'}, status_code=400)
+    if not 1 <= weeks_ahead <= MAX_WEEKS:
+        return JSONResponse({'error': f'weeks harus antara 1 dan {MAX_WEEKS}'}, status_code=400)
+
+    key = (file_digest(MODEL_VERSIONS[name]), weeks_ahead)
+    body = service.responses.get(key) if service.version == data_version(service.path) else None
+    if body is None:
+        # Cache miss (muat data/model, prediksi) dijalankan di thread pool agar event loop tidak terblokir
+        body = await run_in_threadpool(service.forecast, name, weeks_ahead)
+    return Response(body, media_type='application/json')
+
+
+async def models_endpoint(request):
+    return JSONResponse({'models': list(MODEL_VERSIONS), 'default': DEFAULT_MODEL})
+
+
+async def metrics_endpoint(request):
+    # Total per tahap (format teks Prometheus), mis. forecast_predict dan csv_read
+    return Response(prometheus_text(), media_type='text/plain; version=0.0.4')
+
+
+async def health_endpoint(request):
+    return JSONResponse({'status': 'ok', 'data_version': service.version})
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Data dan model dimuat sebelum request pertama diterima
+    await run_in_threadpool(service.warm_up)
+    yield
+
+
+app = Starlette(
+    routes=[
+        Route('/forecast', forecast_endpoint),
+        Route('/models', models_endpoint),
+        Route('/health', health_endpoint),
+        Route('/metrics', metrics_endpoint),
+    ],
+    lifespan=lifespan,
+)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    uvicorn.run(app, host='127.0.0.1', port=port, log_level='warning')
@@ -0,0 +1,159 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from data_loader import DATA_URL, SCHEMA_VERSION, data_version, read_csv
+from ingest import SalesStore, hash_ids
+from rollup import build_rollup
+
+# Dataset bersama lintas proses Streamlit: tabel invoice yang sudah dibersihkan
+# dan agregatnya ditulis sekali sebagai file Arrow IPC di direktori shared
+# memory (mis. /dev/shm), lalu setiap proses memetakannya dengan mmap
+# (read-only, tanpa salinan untuk kolom numerik dan tanggal). File CURRENT
+# berisi versi yang aktif dan ditukar secara atomik (os.replace), sehingga
+# dataset baru bisa dipublikasikan tanpa restart:
+#
+#   SALES_SHARED_DIR=/dev/shm/sales streamlit run app.py
+#   SALES_SHARED_DIR=/dev/shm/sales python shared_data.py [csv]
+
+SHARED_DIR_ENV = 'SALES_SHARED_DIR'
+HANDLE_FILE = 'CURRENT'
+TMP_PREFIX = '.publish-'
+ATTACH_ATTEMPTS = 3
+
+# Tabel yang dipublikasikan: nama -> fungsi (data bersih) -> DataFrame
+TABLES = {
+    'data': lambda data: data,
+    'rollup': build_rollup,
+    'invoice_hashes': lambda data: pd.DataFrame({'hash': hash_ids(data['Invoice ID'])}),
+}
+
+
+def shared_dir():
+    return os.environ.get(SHARED_DIR_ENV) or None
+
+
+def dataset_version(path=DATA_URL):
+    return f'{data_version(path)}-s{SCHEMA_VERSION}'
+
+
+def current_version(root):
+    try:
+        with open(os.path.join(root, HANDLE_FILE)) as file:
+            return file.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _write_table(frame, path):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _swap_handle(root, version):
+    tmp_path = os.path.join(root, f'{TMP_PREFIX}{HANDLE_FILE}-{os.getpid()}')
+    with open(tmp_path, 'w') as file:
+        file.write(version)
+    os.replace(tmp_path, os.path.join(root, HANDLE_FILE))
+
+
+def _remove_old_versions(root, keep):
+    # Versi aktif dan sebelumnya dipertahankan, untuk proses yang baru membaca
+    # CURRENT lama dan belum selesai memetakannya. Proses yang masih memetakan
+    # versi yang dihapus tetap bisa membacanya; file baru dibebaskan setelah
+    # mmap terakhir ditutup
+    for entry in os.scandir(root):
+        if entry.is_dir() and not entry.name.startswith(TMP_PREFIX) and entry.name not in keep:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def publish(path=DATA_URL, root=None):
+    # Idempoten: versi yang sudah ada tidak ditulis ulang. Tabel ditulis ke
+    # direktori sementara lalu di-rename, jadi pembaca tidak pernah melihat
+    # versi setengah jadi; bila dua proses menerbitkan bersamaan, satu menang
+    root = root or shared_dir()
+    os.makedirs(root, exist_ok=True)
+    version = dataset_version(path)
+    target = os.path.join(root, version)
+    if not os.path.isdir(target):
+        data = read_csv(path)
+        tmp_path = tempfile.mkdtemp(prefix=TMP_PREFIX, dir=root)
+        os.chmod(tmp_path, 0o755)
+        for name, build in TABLES.items():
+            _write_table(build(data), os.path.join(tmp_path, f'{name}.arrow'))
+        try:
+            os.rename(tmp_path, target)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    previous = current_version(root)
+    if previous != version:
+        _swap_handle(root, version)
+    _remove_old_versions(root, keep={version, previous})
+    return version
+
+
+class SharedDataset:
+    # Tabel satu versi yang dipetakan dari file Arrow; frame pandas dibuat sekali
+    # per proses dan dipakai bersama oleh semua session (jangan diubah in-place)
+
+    def __init__(self, root, version):
+        start = time.perf_counter()
+        self.version = version
+        self.tables = {}
+        for name in TABLES:
+            source = pa.memory_map(os.path.join(root, version, f'{name}.arrow'))
+            self.tables[name] = pa.ipc.open_file(source).read_all()
+        self.data = self.tables['data'].to_pandas(split_blocks=True)
+        rollup = self.tables['rollup'].to_pandas(split_blocks=True)
+        self.store = SalesStore(rollup, version, self.tables['invoice_hashes'].column('hash').to_numpy())
+        self.stats = {
+            'rows': len(self.data),
+            'load_seconds': time.perf_counter() - start,
+            'memory_bytes': sum(table.nbytes for table in self.tables.values()),
+            'source': 'shared memory',
+        }
+
+    def columns(self, columns=None):
+        # Pemilihan kolom tidak menyalin data (copy-on-write)
+        return self.data[list(columns)] if columns else self.data
+
+
+# Hanya versi aktif yang dipetakan; SharedDataset versi lama dilepas saat
+# versi baru terpasang, supaya halaman shared memory yang sudah dihapus ikut bebas
+@st.cache_resource(show_spinner='Memetakan dataset bersama...', max_entries=1)
+def _attach(root, version):
+    return SharedDataset(root, version)
+
+
+def get_shared_dataset(path=DATA_URL, root=None):
+    # Versi aktif dibaca dari CURRENT setiap rerun; bila CSV berubah (atau belum
+    # pernah dipublikasikan) proses ini menerbitkan versi baru lebih dulu. Bila
+    # versi itu sudah dihapus sebelum sempat dipetakan (publish lain di antara
+    # keduanya), CURRENT dibaca ulang dan versi untuk CSV ini diterbitkan ulang
+    # bila perlu (publish idempoten)
+    root = root or shared_dir()
+    for attempt in range(ATTACH_ATTEMPTS):
+        version = current_version(root)
+        if attempt or version != dataset_version(path):
+            version = publish(path, root)
+        try:
+            return _attach(root, version)
+        except FileNotFoundError:
+            if attempt == ATTACH_ATTEMPTS - 1:
+                raise
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DATA_URL
+    root = shared_dir()
+    if root is None:
+        sys.exit(f'{SHARED_DIR_ENV} belum di-set')
+    print(f'Versi {publish(csv_path, root)} dipublikasikan di {root}')
@@ -0,0 +1,83 @@
+import os
+import shutil
+import sys
+import tempfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Kolom partisi (tahun-bulan) yang ditambahkan saat menulis snapshot
+PARTITION_COLUMN = 'month'
+
+# File penanda yang ditulis terakhir; isinya versi skema data dan versi CSV
+# sumber (data_version: mtime_ns-ukuran) saat snapshot dibuat
+MARKER_FILE = '_SUCCESS'
+
+
+def snapshot_path(csv_path):
+    # supermarket_sales.csv -> supermarket_sales.parquet (direktori)
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _marker_text(schema_version, source_version):
+    return f'{schema_version}\n{source_version}\n'
+
+
+def is_fresh(csv_path, source_version, path=None, schema_version=None):
+    # Segar hanya bila snapshot dibuat dari versi CSV yang persis sama; CSV yang
+    # diganti dengan mtime lebih lama (cp -p, rsync, restore) tetap terdeteksi
+    marker = os.path.join(path or snapshot_path(csv_path), MARKER_FILE)
+    try:
+        with open(marker) as file:
+            return file.read() == _marker_text(schema_version, source_version)
+    except FileNotFoundError:
+        return False
+
+
+def write_snapshot(data, path, schema_version=None, source_version=None):
+    data = data.copy()
+    data[PARTITION_COLUMN] = data['Date'].dt.strftime('%Y-%m')
+    table = pa.Table.from_pandas(data, preserve_index=False)
+
+    # Tulis ke direktori sementara yang unik per penulis lalu tukar, supaya
+    # pembaca tidak pernah melihat snapshot yang setengah jadi dan beberapa
+    # worker yang menyegarkan bersamaan tidak saling menghapus hasil tulisnya
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix=os.path.basename(path) + '.tmp-', dir=parent)
+    old_path = None
+    try:
+        pq.write_to_dataset(table, tmp_path, partition_cols=[PARTITION_COLUMN])
+        with open(os.path.join(tmp_path, MARKER_FILE), 'w') as file:
+            file.write(_marker_text(schema_version, source_version))
+        os.chmod(tmp_path, 0o755)
+        # Direktori lama dipindah dulu (rename atomik), baru dihapus
+        if os.path.exists(path):
+            old_path = tempfile.mkdtemp(prefix=os.path.basename(path) + '.old-', dir=parent)
+            try:
+                os.replace(path, os.path.join(old_path, 'snapshot'))
+            except FileNotFoundError:
+                pass
+        os.replace(tmp_path, path)
+    except OSError:
+        # Penulis lain lebih dulu menukar snapshot-nya; hasil tulis ini dibuang
+        if not os.path.exists(path):
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if old_path is not None:
+            shutil.rmtree(old_path, ignore_errors=True)
+    return path
+
+
+def read_snapshot(path, columns=None, memory_map=True):
+    table = pq.read_table(path, columns=list(columns) if columns else None, memory_map=memory_map)
+    data = table.to_pandas()
+    return data.drop(columns=PARTITION_COLUMN, errors='ignore')
+
+
+if __name__ == '__main__':
+    from data_loader import DATA_URL, convert_snapshot
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DATA_URL
+    print(f'Snapshot ditulis ke {convert_snapshot(csv_path)}')
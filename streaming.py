@@ -0,0 +1,118 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import streamlit as st
+
+import snapshot
+from data_loader import SCHEMA, SCHEMA_VERSION, clean_data, data_version
+from instrumentation import stage
+from ingest import STORE_COLUMNS, SalesStore, hash_ids, merge_rollups
+from rollup import build_rollup
+
+# Mode streaming: sumber (CSV atau snapshot Parquet) dibaca per chunk dengan
+# ukuran terbatas, setiap chunk diringkas menjadi agregat parsial yang bisa
+# digabung (rollup, hash Invoice ID, jumlah baris), lalu chunk dibuang.
+# Memori puncak ditentukan oleh ukuran chunk dan ukuran agregat, bukan oleh
+# panjang histori transaksi.
+
+# Batas memori (MB) untuk mode streaming; kosong berarti mode biasa (semua baris dimuat)
+MEMORY_ENV = 'SALES_STREAMING_MEMORY_MB'
+
+STREAM_COLUMNS = STORE_COLUMNS
+
+# Porsi batas memori untuk satu chunk; sisanya untuk buffer parser dan agregat
+CHUNK_FRACTION = 0.25
+SAMPLE_ROWS = 1000
+MIN_CHUNK_ROWS = 1000
+
+
+def memory_cap_mb():
+    value = os.environ.get(MEMORY_ENV, '').strip()
+    return int(value) if value else None
+
+
+def chunk_rows(path, memory_mb, columns=STREAM_COLUMNS):
+    # Perkiraan byte per baris dari sampel awal CSV, dikonversi ke jumlah baris per chunk
+    sample = clean_data(pd.read_csv(path, usecols=columns, dtype={column: SCHEMA[column] for column in columns},
+                                    nrows=SAMPLE_ROWS))
+    row_bytes = sample.memory_usage(deep=True).sum() / max(len(sample), 1)
+    return max(MIN_CHUNK_ROWS, int(memory_mb * 1024 ** 2 * CHUNK_FRACTION / row_bytes))
+
+
+def csv_chunks(path, rows, columns=STREAM_COLUMNS):
+    dtype = {column: SCHEMA[column] for column in columns}
+    for chunk in pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=rows):
+        yield clean_data(chunk)
+
+
+def snapshot_chunks(path, rows, columns=STREAM_COLUMNS):
+    dataset = ds.dataset(path, format='parquet', partitioning='hive')
+    for batch in dataset.to_batches(columns=columns, batch_size=rows):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+class PartialAggregates:
+    # Agregat yang dipakai Dashboard dan Forecasting; dua agregat parsial
+    # digabung dengan merge(), jadi urutan dan ukuran chunk tidak memengaruhi hasil
+
+    def __init__(self, rollup=None, rows=0, id_hashes=None):
+        self.rollup = rollup
+        self.rows = rows
+        self.id_hashes = id_hashes
+
+    @classmethod
+    def from_chunk(cls, chunk, track_ids=False):
+        return cls(build_rollup(chunk), len(chunk), hash_ids(chunk['Invoice ID']) if track_ids else None)
+
+    def merge(self, other):
+        rollup = other.rollup if self.rollup is None else merge_rollups([self.rollup, other.rollup])
+        id_hashes = other.id_hashes if self.id_hashes is None else np.concatenate([self.id_hashes, other.id_hashes])
+        return PartialAggregates(rollup, self.rows + other.rows, id_hashes)
+
+
+def stream_aggregates(path, memory_mb, track_ids=False):
+    # Snapshot Parquet dipakai bila masih segar; snapshot tidak dibuat di mode
+    # ini karena pembuatannya memuat seluruh CSV
+    start = time.perf_counter()
+    rows = chunk_rows(path, memory_mb)
+    if snapshot.is_fresh(path, data_version(path), schema_version=SCHEMA_VERSION):
+        chunks, source = snapshot_chunks(snapshot.snapshot_path(path), rows), 'parquet'
+    else:
+        chunks, source = csv_chunks(path, rows), 'csv'
+
+    aggregates = PartialAggregates()
+    count, peak_bytes = 0, 0
+    with stage('stream_aggregate') as info:
+        for chunk in chunks:
+            peak_bytes = max(peak_bytes, int(chunk.memory_usage(deep=True).sum()))
+            aggregates = aggregates.merge(PartialAggregates.from_chunk(chunk, track_ids))
+            count += 1
+            del chunk
+        info['rows'] = aggregates.rows
+
+    stats = {
+        'rows': aggregates.rows,
+        'chunks': count,
+        'chunk_rows': rows,
+        'peak_chunk_bytes': peak_bytes,
+        'memory_cap_bytes': memory_mb * 1024 ** 2,
+        'load_seconds': time.perf_counter() - start,
+        'source': f'streaming {source}',
+    }
+    return aggregates, stats
+
+
+@st.cache_resource(show_spinner='Mengagregasi dataset per chunk...', max_entries=2)
+def _get_streaming_store(path, version, memory_mb):
+    aggregates, stats = stream_aggregates(path, memory_mb)
+    return SalesStore(aggregates.rollup, version, aggregates.id_hashes), aggregates, stats
+
+
+def get_streaming_store(path, memory_mb):
+    # Store dari agregat streaming: Invoice ID tidak disimpan, jadi dedup batch
+    # baru hanya berlaku antar batch yang di-ingest
+    return _get_streaming_store(path, data_version(path), memory_mb)
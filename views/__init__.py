@@ -0,0 +1,8 @@
+# Satu modul per halaman, masing-masing dengan render(data, store). Modul
+# halaman (dan library berat yang dipakainya) baru diimpor saat halaman itu
+# dipilih, lihat app.py.
+PAGES = {
+    'Sales Analysis': 'views.sales_analysis',
+    'Dashboard': 'views.dashboard',
+    'Forecasting': 'views.forecasting',
+}
@@ -0,0 +1,90 @@
+import pandas as pd
+import seaborn as sns
+import streamlit as st
+
+from downsample import downsample, figure_width_px, point_budget
+from filter_index import get_filter_index
+from instrumentation import stage
+from rendering import session_figure, show_figure
+from rollup import rating_histogram, sales_by
+
+
+def render(data, store):
+    # Semua grafik dijawab dari rollup (Date x Branch x City x Product line),
+    # bukan dari baris invoice mentah
+    filter_index = get_filter_index(store.rollup, store.version)
+
+    sns.set(style='darkgrid')
+
+    # Sidebar untuk filter rentang waktu
+    with st.sidebar:
+        st.header('Filter Data')
+        min_date, max_date = filter_index.date_range()
+        start_date = st.date_input('Start date', pd.Timestamp(min_date))
+        end_date = st.date_input('End date', pd.Timestamp(max_date))
+        branch_filter = st.multiselect('Branch', filter_index.categories('Branch'), filter_index.categories('Branch'))
+        city_filter = st.multiselect('City', filter_index.categories('City'), filter_index.categories('City'))
+
+    # Rentang tanggal lewat binary search, Branch/City lewat bitmap
+    with stage('filter') as info:
+        filtered_data = filter_index.filter(start_date, end_date, {'Branch': branch_filter, 'City': city_filter})
+        info['rows'] = len(filtered_data)
+
+    st.title('Sales Dashboard')
+
+    # Visualisasi 1: Penjualan berdasarkan tanggal (line chart)
+    st.subheader('Penjualan Berdasarkan Tanggal')
+    daily_sales = sales_by(filtered_data, 'Date')
+
+    with session_figure('dashboard_daily') as (fig, ax):
+        # Hanya min/max per bucket selebar figure yang digambar
+        daily_points = downsample(daily_sales, point_budget(figure_width_px(fig)), x='Date')
+        sns.lineplot(data=daily_points, x='Date', y='Total', ax=ax, color='green')
+        ax.set_title('Total Penjualan per Tanggal')
+        ax.set_xlabel('Tanggal')
+        ax.set_ylabel('Total Penjualan')
+        ax.tick_params(axis='x', labelrotation=45)
+        show_figure(fig)
+
+    # Visualisasi 2: Penjualan berdasarkan bulan
+    st.subheader('Penjualan Berdasarkan Bulan')
+    monthly_sales = sales_by(filtered_data.assign(Month=filtered_data['Date'].dt.month), 'Month')
+
+    with session_figure('dashboard_monthly') as (fig, ax):
+        sns.barplot(data=monthly_sales, x='Month', y='Total', ax=ax, palette='Blues_d')
+        ax.set_title('Total Penjualan per Bulan')
+        show_figure(fig)
+
+    # Visualisasi 3: Penjualan berdasarkan Cabang
+    st.subheader('Penjualan Berdasarkan Cabang')
+    branch_sales = sales_by(filtered_data, 'Branch')
+
+    with session_figure('dashboard_branch') as (fig, ax):
+        sns.barplot(data=branch_sales, x='Branch', y='Total', ax=ax, palette='Oranges_d')
+        ax.set_title('Total Penjualan per Cabang')
+        show_figure(fig)
+
+    # Visualisasi 4: Distribusi Rating
+    st.subheader('Distribusi Rating')
+    rating_bins, rating_counts = rating_histogram(filtered_data)
+    # Setiap bin diwakili titik tengahnya, supaya kurva KDE tidak bergeser setengah bin dari batangnya
+    rating_data = pd.DataFrame({'Rating': (rating_bins[:-1] + rating_bins[1:]) / 2, 'count': rating_counts})
+    if len(rating_counts) == 0:
+        st.info('Tidak ada transaksi yang cocok dengan filter ini.')
+    else:
+        # KDE butuh minimal dua titik berbeda (dua bin berisi)
+        with session_figure('dashboard_rating') as (fig, ax):
+            sns.histplot(data=rating_data, x='Rating', weights='count', bins=list(rating_bins),
+                         kde=bool((rating_counts > 0).sum() >= 2), ax=ax, color='green')
+            ax.set_title('Distribusi Rating Pelanggan')
+            show_figure(fig)
+
+    # Visualisasi 5: Penjualan Berdasarkan Garis Produk
+    st.subheader('Penjualan Berdasarkan Garis Produk')
+    product_sales = sales_by(filtered_data, 'Product line')
+
+    with session_figure('dashboard_product') as (fig, ax):
+        sns.barplot(data=product_sales, x='Product line', y='Total', ax=ax, palette='Purples_d')
+        ax.set_title('Total Penjualan per Garis Produk')
+        ax.tick_params(axis='x', labelrotation=45)
+        show_figure(fig)
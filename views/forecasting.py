@@ -0,0 +1,100 @@
+import streamlit as st
+
+from downsample import downsample, figure_width_px, point_budget
+from forecasting import (add_calendar_features, batch_forecast, forecast, get_forecast_intervals, get_period_model,
+                         get_period_sales, get_weekly_sales_matrix)
+from model_registry import DEFAULT_MODEL, MODEL_VERSIONS, get_model
+
+
+# Granularitas di UI: label -> (kode, label periode, default dan maksimum horizon)
+GRANULARITY_OPTIONS = {
+    'Mingguan': ('W', 'minggu', 12, 52),
+    'Harian': ('D', 'hari', 30, 90),
+    'Bulanan': ('M', 'bulan', 3, 12),
+}
+
+
+def render(data, store):
+    # Streamlit App Title
+    st.title("Sales Forecasting App with Linear Regression")
+
+    # Tampilkan beberapa baris data
+    st.subheader("Dataset Supermarket Sales")
+    st.write(add_calendar_features(data.head()))
+
+    # Seri per granularitas diturunkan dari agregat harian store (diperbarui
+    # inkremental saat ada invoice baru) dan di-cache per versi data
+    granularity_label = st.radio("Granularitas", list(GRANULARITY_OPTIONS), horizontal=True)
+    granularity, period_name, default_periods, max_periods = GRANULARITY_OPTIONS[granularity_label]
+    sales_series = get_period_sales(store.daily, store.version, granularity)
+
+    # Visualisasi Data Historis Penjualan; seri panjang dipangkas ke anggaran
+    # titik selebar grafik (min/max per bucket) sebelum dikirim ke browser
+    st.subheader(f"Visualisasi Penjualan {granularity_label}")
+    st.line_chart(downsample(sales_series))
+
+    # User input: versi model dan berapa periode ke depan untuk forecasting
+    model_name = st.selectbox("Model", list(MODEL_VERSIONS), index=list(MODEL_VERSIONS).index(DEFAULT_MODEL))
+    periods_ahead = st.number_input(f"Masukkan jumlah {period_name} ke depan untuk prediksi:", min_value=1,
+                                    max_value=max_periods, value=default_periods, key=f'periods_{granularity}')
+
+    # Prediksi setelah tombol ditekan; hasil tetap tampil saat granularitas atau
+    # horizon diganti, sehingga ganti granularitas hanya memanggil predict
+    if st.button("Prediksi Penjualan"):
+        st.session_state['forecast_requested'] = True
+    if st.session_state.get('forecast_requested'):
+        # Memuat model (lazy, satu instance per proses). Model pickle dilatih pada
+        # indeks minggu; granularitas lain memakai regresi indeks periode dengan
+        # alpha yang sama, di-fit sekali per versi data
+        loaded_model, model_info = get_model(model_name)
+        alpha = getattr(loaded_model, 'alpha', 0.0)
+        if granularity != 'W':
+            loaded_model = get_period_model(sales_series, store.version, granularity, alpha)
+        st.caption(f"Model {model_name} ({model_info['sha256'][:12]}) "
+                   f"dimuat dalam {model_info['load_seconds'] * 1000:.1f} ms")
+
+        # Melakukan prediksi untuk periode setelah data historis, ditambah
+        # interval P10/P50/P90 dari residual bootstrap di sekitar prediksi model ini
+        future_predictions_df = forecast(loaded_model, sales_series, periods_ahead, granularity)
+        future_predictions_df = future_predictions_df.join(
+            get_forecast_intervals(loaded_model, model_info['sha256'], sales_series, store.version, periods_ahead,
+                                   granularity))
+
+        # Menampilkan hasil prediksi
+        st.subheader(f"Prediksi penjualan untuk {periods_ahead} {period_name} ke depan:")
+        st.write(future_predictions_df)
+
+        # Visualisasi hasil prediksi
+        st.line_chart(downsample(future_predictions_df))
+
+        # seaborn/matplotlib baru diimpor di sini, hanya setelah tombol ditekan
+        import seaborn as sns
+
+        from rendering import session_figure, show_figure
+
+        # Plotting gabungan data historis dan prediksi masa depan, dengan pita P10-P90
+        st.subheader("Visualisasi penjualan historis dan prediksi masa depan")
+        with session_figure('forecasting_combined', (12, 6)) as (fig, ax):
+            history = downsample(sales_series, point_budget(figure_width_px(fig)))
+            ax.plot(history.index, history, label='Total')
+            ax.plot(future_predictions_df.index, future_predictions_df['Predicted Sales'], label='Predicted Sales')
+            ax.fill_between(future_predictions_df.index, future_predictions_df['P10'], future_predictions_df['P90'],
+                            alpha=0.3, color='tab:orange', label='P10-P90')
+            ax.legend()
+            show_figure(fig)
+
+        # Prediksi per Cabang x Garis Produk (granularitas mingguan): semua seri di-fit
+        # sekaligus dengan formulasi indeks minggu yang sama (alpha mengikuti model yang dipilih)
+        if granularity == 'W':
+            st.subheader("Prediksi penjualan per Cabang dan Garis Produk")
+            sales_matrix = get_weekly_sales_matrix(store.rollup, store.version)
+            group_predictions_df = batch_forecast(sales_matrix, periods_ahead, alpha=alpha)
+            st.dataframe(group_predictions_df, hide_index=True)
+
+        # Analisis tambahan: Visualisasi distribusi produk yang terjual
+        st.subheader("Distribusi Produk yang Terjual per Garis Produk")
+        product_sales = store.rollup.groupby('Product line', observed=True)['Quantity'].sum().reset_index()
+        with session_figure('forecasting_product') as (fig, ax):
+            sns.barplot(x='Product line', y='Quantity', data=product_sales, ax=ax)
+            ax.tick_params(axis='x', labelrotation=45)
+            show_figure(fig)
@@ -0,0 +1,562 @@
+import pandas as pd
+import streamlit as st
+
+from backtest import load_metrics
+from forecasting import get_period_sales
+from sales_charts import get_chart_job
+
+
+def render(data, store):
+    # Latar Belakang
+    st.title("Sales Forecasting Analysis")
+    st.markdown("""
+        ## Latar Belakang
+
+        ### 1. Pendahuluan
+        Dalam dunia bisnis yang kompetitif saat ini, kemampuan untuk memprediksi penjualan di masa depan merupakan kunci untuk mengambil keputusan strategis. Penjualan merupakan indikator utama kesehatan bisnis dan sering kali menjadi dasar perencanaan anggaran, alokasi sumber daya, dan strategi pemasaran. Sebuah perusahaan yang mampu memperkirakan penjualan secara akurat dapat mengoptimalkan inventaris, mengurangi biaya penyimpanan, dan merespons perubahan permintaan pasar dengan lebih efektif.
+
+        Namun, membuat prediksi penjualan bukanlah tugas yang mudah. Banyak faktor yang mempengaruhi penjualan, termasuk tren musiman, perilaku konsumen, dan kondisi ekonomi. Kesalahan dalam memprediksi penjualan bisa berujung pada kelebihan atau kekurangan stok, yang masing-masing membawa dampak negatif bagi bisnis. Oleh karena itu, diperlukan metode yang canggih dan andal untuk membantu perusahaan dalam membuat prediksi penjualan yang akurat.
+
+        ### 2. Pentingnya Sales Forecasting
+        Sales forecasting penting karena beberapa alasan utama:
+
+        - Perencanaan Produksi: Dengan prediksi yang akurat, perusahaan dapat merencanakan produksi dengan tepat, menghindari kelebihan atau kekurangan stok.
+        - Pengelolaan Persediaan: Forecasting membantu mengurangi biaya penyimpanan dan mencegah kerugian akibat produk yang tidak terjual.
+        - Strategi Penjualan: Memprediksi penjualan memungkinkan perusahaan untuk merancang strategi penjualan yang lebih efektif, seperti menentukan diskon atau promosi pada waktu yang tepat.
+        - Keputusan Keuangan: Forecasting yang baik membantu dalam perencanaan anggaran dan alokasi sumber daya, sehingga meningkatkan efisiensi keuangan.
+
+        ### 3. Mengapa Menggunakan Data Science untuk Sales Forecasting
+        Pendekatan tradisional dalam forecasting sering kali mengandalkan metode manual atau intuisi, yang rentan terhadap kesalahan dan bias. Dengan perkembangan dalam data science, sekarang kita dapat menggunakan teknik machine learning untuk melakukan sales forecasting dengan lebih akurat dan efisien. Keuntungan menggunakan data science dalam sales forecasting antara lain:
+
+        - Akurasi yang Lebih Tinggi: Model machine learning dapat menganalisis pola dari data historis dan membuat prediksi yang lebih akurat dibandingkan dengan metode konvensional.
+        - Penyesuaian Terhadap Perubahan Pasar: Algoritma machine learning dapat dilatih ulang secara berkala untuk menyesuaikan dengan tren pasar yang berubah, memastikan prediksi tetap relevan.
+        - Identifikasi Faktor-Faktor yang Mempengaruhi Penjualan: Data science memungkinkan analisis mendalam untuk mengidentifikasi variabel-variabel yang paling mempengaruhi penjualan, seperti musim, kampanye pemasaran, atau tren ekonomi.
+        - Efisiensi Waktu: Automasi dalam proses forecasting memungkinkan perusahaan untuk menghemat waktu dan fokus pada implementasi strategi bisnis.
+
+        ### 4. Metodologi
+        Proyek sales forecasting ini akan menggunakan metodologi berbasis data science dan machine learning, yang melibatkan beberapa tahapan berikut:
+
+        - Pengumpulan Data: Mengumpulkan data historis penjualan yang mencakup berbagai variabel seperti waktu, produk, harga, dan kampanye pemasaran.
+        - Eksplorasi dan Preprocessing Data: Mengeksplorasi data untuk memahami pola dan anomali, serta melakukan preprocessing seperti pengisian nilai yang hilang, normalisasi, dan encoding variabel kategorikal.
+        - Pemilihan Fitur: Mengidentifikasi dan memilih fitur-fitur yang paling relevan untuk digunakan dalam model prediksi, berdasarkan korelasi dengan target penjualan.
+        - Pengembangan Model: Menggunakan algoritma regresi seperti linear regression, atau Arima untuk membangun model prediksi penjualan.
+        - Evaluasi Model: Mengevaluasi kinerja model menggunakan metrik seperti mean absolute error (MAE), root mean square error (RMSE), dan R-squared untuk memastikan akurasi prediksi.
+        - Implementasi dan Pemantauan: Mengimplementasikan model dalam sistem operasional perusahaan dan memantau kinerjanya secara berkelanjutan, serta melakukan penyesuaian jika diperlukan.
+
+        ### 5. Kesimpulan
+        Sales forecasting adalah langkah penting dalam strategi bisnis yang dapat memberikan perusahaan keunggulan kompetitif. Dengan memanfaatkan data science dan teknik machine learning, perusahaan dapat meningkatkan akurasi prediksi penjualan, mengoptimalkan operasional, dan membuat keputusan strategis yang lebih baik. Proyek ini bertujuan untuk mengembangkan model sales forecasting yang andal dan dapat diterapkan secara efektif dalam berbagai konteks bisnis.
+    
+                """)
+    
+
+    #Business Undersatnding
+    st.header('Business Understanding')
+    st.write("""
+        Berdasarkan latar belakang yang telah diuraikan, muncul pertanyaan penting: bagaimana perusahaan dapat secara efektif memprediksi penjualan di masa depan dan mengambil langkah-langkah strategis untuk mengoptimalkan operasional? Dengan memahami faktor-faktor yang mempengaruhi penjualan, perusahaan dapat merancang strategi yang lebih baik untuk mengelola inventaris, merencanakan produksi, dan meningkatkan efisiensi dalam pengelolaan sumber daya. Kemampuan untuk memprediksi penjualan dengan akurat akan memastikan perusahaan tetap kompetitif dan mampu merespons perubahan pasar dengan lebih cepat.
+             """)
+    
+    #Problem Statement
+    st.header('Problem Statements')
+    st.write("""
+        Untuk mencapai tujuan ini, proyek sales forecasting ini akan fokus pada menjawab beberapa pertanyaan kunci berikut:
+
+        1. Bagaimana distribusi penjualan di berbagai cabang dan kota?
+        Mengetahui distribusi penjualan di berbagai lokasi adalah langkah awal untuk memahami performa cabang dan mengidentifikasi cabang yang memerlukan perhatian lebih.
+
+        2. Apakah terdapat perbedaan penjualan antara tipe pelanggan yang berbeda (Customer type)?
+        Menganalisis kontribusi dari pelanggan baru dan loyal dapat membantu dalam merancang strategi pemasaran yang lebih tepat sasaran.
+
+        3. Bagaimana pola pembelian berdasarkan gender?
+        Menganalisis perbedaan pembelian antara pelanggan pria dan wanita dapat memberikan wawasan tentang preferensi masing-masing kelompok, yang penting untuk strategi pemasaran yang efektif.
+
+        4. Produk mana yang paling laris?
+        Mengevaluasi kinerja setiap garis produk akan membantu perusahaan dalam mengelola portofolio produk dan menentukan produk mana yang perlu dipromosikan lebih lanjut.
+
+        5. Metode pembayaran mana yang paling sering digunakan?
+        Mengetahui preferensi metode pembayaran dapat membantu dalam penawaran promosi atau program loyalitas yang sesuai.
+
+        6. Bagaimana distribusi penjualan berdasarkan waktu (tanggal dan jam)?
+        Memahami kapan penjualan puncak terjadi dapat membantu dalam perencanaan stok dan staf yang lebih efisien.
+
+        7. Bagaimana hubungan antara unit price dan quantity?
+        Analisis ini dapat memberikan wawasan apakah harga produk mempengaruhi jumlah pembelian, yang penting untuk pengelolaan harga dan promosi.
+
+        8. Bagaimana pendapatan kotor dan margin laba berhubungan dengan total penjualan?
+        Mengetahui hubungan ini dapat membantu perusahaan dalam menentukan strategi penetapan harga dan optimasi margin.
+
+        9. Apakah rating pelanggan berhubungan dengan total penjualan?
+        Menganalisis hubungan antara rating pelanggan dan penjualan dapat membantu perusahaan memahami kepuasan pelanggan dan dampaknya terhadap performa bisnis.
+             """)
+
+    #Goals
+    st.header('Goals')
+    st.write("""
+        Untuk menjawab pertanyaan-pertanyaan di atas, akan dilakukan analisis mendalam dengan tujuan sebagai berikut:
+
+        1. Mengembangkan Model Prediksi Penjualan: Menggunakan teknik machine learning untuk membangun model yang dapat memprediksi penjualan masa depan, berdasarkan data historis dan faktor-faktor relevan yang telah diidentifikasi.
+        2. Mengidentifikasi Faktor-Faktor yang Mempengaruhi Penjualan: Menentukan faktor-faktor kunci yang berkontribusi terhadap penjualan, sehingga perusahaan dapat fokus pada aspek-aspek yang paling berdampak terhadap pendapatan.
+        3. Merancang Strategi Bisnis yang Lebih Efektif: Menggunakan hasil analisis untuk mengembangkan strategi penjualan, pemasaran, dan inventaris yang lebih efektif, termasuk promosi produk yang tepat waktu dan penyesuaian harga.
+        4. Meningkatkan Efisiensi Operasional: Mengoptimalkan alokasi sumber daya dengan fokus pada waktu dan produk yang paling menguntungkan, sehingga perusahaan dapat meningkatkan efisiensi dan menurunkan biaya operasional.
+        
+        Dengan pendekatan ini, proyek sales forecasting bertujuan untuk memberikan perusahaan alat yang kuat untuk mengelola penjualan, meningkatkan profitabilitas, dan memperkuat posisi kompetitif di pasar.
+             """)
+
+    #Informasi Dataset
+
+    # Data Collection
+    st.title("Dataset Infomation")
+    st.write("Saya menggunakan dataset yang diambil dari platform Kaggle.")
+    st.write("Link Dataset: [Super Market Sales Dataset](https://www.kaggle.com/datasets/arunjangir245/super-market-sales/data)")
+
+    st.write(data.info())
+
+    # Statistik deskriptif dari profil sketch (satu kali pindai, disimpan per versi data)
+    profile = store.profile(data)
+    data = store.rows(data)
+
+    # Display data
+    st.write("Preview Dataset")
+    st.write(data.head())
+
+    #Cheking data type
+    st.write(data.info())
+    st.write("""
+             Mengecek data type pada masing masing fitur
+             """)
+    st.code("""
+            <class 'pandas.core.frame.DataFrame'>
+            RangeIndex: 1000 entries, 0 to 999
+            Data columns (total 17 columns):
+            #   Column                   Non-Null Count  Dtype  
+            ---  ------                   --------------  -----  
+            0   Invoice ID               1000 non-null   object 
+            1   Branch                   1000 non-null   object 
+            2   City                     1000 non-null   object 
+            3   Customer type            1000 non-null   object 
+            4   Gender                   1000 non-null   object 
+            5   Product line             1000 non-null   object 
+            6   Unit price               1000 non-null   float64
+            7   Quantity                 1000 non-null   int64  
+            8   Tax 5%                   1000 non-null   float64
+            9   Total                    1000 non-null   float64
+            10  Date                     1000 non-null   object 
+            11  Time                     1000 non-null   object 
+            12  Payment                  1000 non-null   object 
+            13  cogs                     1000 non-null   float64
+            14  gross margin percentage  1000 non-null   float64
+            15  gross income             1000 non-null   float64
+            16  Rating                   1000 non-null   float64
+            dtypes: float64(7), int64(1), object(9)
+            memory usage: 132.9+ KB
+            """)
+    st.write("""
+             Pada dataframe data memiliki 17 feature atau column dan 1000 nilai non-null dalam setiap feature-feature yang ada. feature yang memiliki tipe data int64 sebanyak 1 sedangkan dengan feature yang memiliki tipe data float64 sebanyak 7. feature Date dan Time memiliki tipe data yang salah sehingga harus diubah, dan sisanya merupakan feature yang bertipe data kategorikal.
+            """)
+    st.write("""
+             Mengecek Missing Value pada dataset
+             """)
+    st.code("""
+            profile = store.profile(data)
+            profile.null_counts()
+            """, language='python')
+    st.write("Jumlah Missing value data pada dataframe:", profile.null_counts())
+    st.write("""
+             Mengecek data duplicate pada dataset
+             """)
+    st.code("""
+            # Cek duplikat dengan hash set atas Invoice ID
+            profile.duplicates
+            """, language='python')
+    st.write("Jumlah duplikasi Invoice ID pada dataframe:", profile.duplicates)
+    st.write("""
+             Melihat deskripsi statistik pada dataset
+             """)
+    st.write(profile.describe())
+    st.caption(f"Kuantil dari t-digest, jumlah nilai unik Invoice ID dari HyperLogLog "
+               f"(standar error ±{profile.columns['Invoice ID'].unique.error:.1%})")
+
+    # Fixing Data Types
+    st.title("Cleaning Data")
+    st.write("Mengubah tipe data yang salah")
+    st.code("""
+            data['Date'] = pd.to_datetime(data['Date'], format='%m/%d/%Y')
+            # Time disimpan sebagai menit sejak tengah malam (int16)
+            time = pd.to_datetime(data['Time'], format='%H:%M')
+            data['Time'] = (time.dt.hour * 60 + time.dt.minute).astype('int16')
+            """, language='python')
+    st.write("""
+             Mengecek kembali missing value
+             """)
+    st.code("""
+            profile.null_counts()
+            """, language='python')
+    st.write("Jumlah Missing value data pada dataframe:", profile.null_counts())
+    
+
+    # Exploratory Data Analysis
+    st.title("Exploratory Data Analysis (EDA)")
+
+    # Grafik dirender sekali per versi data di background dan disajikan dari cache
+    chart_job = get_chart_job(data, store.version, profile)
+
+    # Analysis by Branch and City
+    st.subheader("Analisis Penjualan Berdasarkan Cabang dan Kota")
+    st.image(chart_job.get('branch_city'))
+    st.write("""
+            - Grafik ini menunjukkan total penjualan berdasarkan cabang dan kota.
+            - Cabang C (Naypyitaw) memiliki penjualan tertinggi, diikuti oleh Cabang A (Yangon) dan B (Mandalay).
+            - Tidak ada perbedaan signifikan dalam penjualan antara cabang A dan B, tetapi cabang C menunjukkan sedikit keunggulan dalam total penjualan.
+             """)
+
+    # Analysis by Customer Type
+    st.subheader("Analisis Tipe Pelanggan")
+    st.image(chart_job.get('customer_type'))
+    st.write("""
+            - Grafik ini menunjukkan total penjualan berdasarkan tipe pelanggan, yaitu Member dan Normal.
+            - Penjualan dari pelanggan Member dan Normal terlihat sangat seimbang, dengan kontribusi yang hampir sama terhadap total penjualan.
+            - Hal ini mengindikasikan bahwa baik pelanggan baru maupun pelanggan yang sudah terdaftar sebagai member memberikan kontribusi yang setara dalam penjualan.
+
+             """)
+
+    # Analysis by Gender
+    st.subheader("Analisis Gender")
+    st.image(chart_job.get('gender_box'))
+    st.write("""
+            - Grafik ini adalah box plot yang menunjukkan distribusi total penjualan berdasarkan gender.
+            - Median penjualan untuk pelanggan pria dan wanita hampir sama, dengan rentang distribusi yang juga serupa.
+            - Tidak ada perbedaan yang signifikan antara total penjualan yang dilakukan oleh pelanggan pria dan wanita. Kedua gender menunjukkan distribusi penjualan yang mirip.
+             """)
+
+    # Analysis by Product Line
+    st.subheader("Analisis Garis Produk")
+    st.image(chart_job.get('product_line'))
+    st.write("""
+            - Grafik ini menunjukkan total penjualan per garis produk.
+            - Semua garis produk, termasuk Health and Beauty, Electronic Accessories, Home and Lifestyle, Sports and Travel, Food and Beverages, dan Fashion Accessories, memiliki total penjualan yang relatif seimbang.
+            - Tidak ada garis produk yang mendominasi penjualan secara signifikan, menunjukkan distribusi yang cukup merata di antara produk yang ditawarkan
+             """)
+
+    st.image(chart_job.get('price_quantity_by_product'))
+    st.write("""
+            - Grafik ini adalah scatter plot yang menunjukkan hubungan antara harga satuan (unit price) dan jumlah pembelian (quantity) per garis produk.
+            - Garis produk ditandai dengan warna yang berbeda, namun tidak ada pola jelas yang menunjukkan bahwa harga yang lebih tinggi cenderung dibeli dalam jumlah yang lebih kecil atau sebaliknya.
+            - Distribusi unit price dan quantity tersebar secara merata di berbagai garis produk, menunjukkan variasi dalam preferensi pelanggan terkait harga dan kuantitas pembelian.
+             """)
+
+    # Analysis by Payment Method
+    st.subheader("Analisis Metode Pembayaran")
+    st.image(chart_job.get('payment_pie'))
+    st.write("""
+            - Pie chart ini menunjukkan distribusi penggunaan metode pembayaran di antara pelanggan.
+            - Ewallet merupakan metode pembayaran yang paling sering digunakan dengan persentase 34,5%, diikuti oleh Cash dengan 34,4%, dan Credit Card dengan 31,1%.
+            - Distribusi ini relatif merata, meskipun Ewallet sedikit lebih dominan dibanding metode pembayaran lainnya.
+             """)
+
+    st.image(chart_job.get('payment_box'))
+    st.write("""
+            - Box plot ini membandingkan total penjualan yang dihasilkan dari masing-masing metode pembayaran.
+            - Median penjualan untuk ketiga metode pembayaran cukup seimbang, dengan distribusi penjualan yang mirip.
+            - Ada beberapa outliers yang menunjukkan adanya transaksi dengan total penjualan yang sangat tinggi pada semua metode pembayaran.
+             """)
+
+    # Analysis by Sales Time
+    st.subheader("Analisis Waktu Penjualan")
+    st.image(chart_job.get('daily_sales'))
+    st.write("""
+            - Line chart ini menunjukkan tren penjualan harian selama periode waktu tertentu.
+            - Penjualan cenderung fluktuatif setiap hari, dengan beberapa puncak penjualan pada tanggal-tanggal tertentu.
+            - Tidak ada pola yang jelas seperti peningkatan atau penurunan yang konsisten, tetapi tren umum menunjukkan variasi penjualan yang cukup tinggi setiap hari.
+             """)
+
+    st.image(chart_job.get('hour_date_heatmap'))
+    st.write("""
+            - Heatmap ini menunjukkan intensitas penjualan berdasarkan kombinasi waktu (jam) dan tanggal.
+            - Warna yang lebih gelap menunjukkan volume penjualan yang lebih tinggi.
+            - Penjualan cenderung lebih tinggi di beberapa jam tertentu pada beberapa tanggal, menunjukkan waktu-waktu puncak yang mungkin terkait dengan kebiasaan pelanggan.
+             """)
+
+    # Analysis by Unit Price and Quantity
+    st.subheader("Analisis Harga Satuan dan Jumlah Pembelian")
+    st.image(chart_job.get('price_quantity'))
+    st.write("""
+            - Scatter plot ini menunjukkan hubungan antara harga satuan (unit price) dan jumlah pembelian (quantity).
+            - Tidak ada pola yang jelas di antara dua variabel ini, yang menunjukkan bahwa produk dengan harga tinggi atau rendah dapat dibeli dalam jumlah besar atau kecil tanpa ada kecenderungan khusus.
+             """)
+
+    # Analysis by Gross Income and Margin
+    st.subheader("Analisis Pendapatan Kotor dan Margin Laba")
+    st.image(chart_job.get('income_margin'))
+    st.write("""
+            - Scatter plot ini menunjukkan hubungan antara gross income, gross margin percentage, dan garis produk.
+            - Gross margin percentage tampak relatif konstan di seluruh garis produk, dengan nilai sekitar 4,76%.
+            - Gross income bervariasi tergantung pada garis produk, tetapi tidak ada hubungan signifikan yang terlihat antara gross margin dan gross income dalam data ini.
+             """)
+
+    # Analysis by Customer Rating
+    st.subheader("Analisis Rating Pelanggan")
+    st.image(chart_job.get('rating_total'))
+    st.write("""
+            - Distribusi Rating: Rating pelanggan berkisar antara 4 hingga 10, dengan titik-titik yang tersebar merata di seluruh rentang ini.
+            - Distribusi Penjualan: Total penjualan bervariasi dari 0 hingga lebih dari 1000, tanpa ada tren yang jelas yang menunjukkan hubungan kuat antara rating dan total penjualan.
+            - Ketiadaan Hubungan yang Kuat: Dari pola scatter plot ini, tidak tampak ada hubungan linear atau tren yang jelas antara rating dan total penjualan. Penjualan tinggi dapat terjadi pada rating rendah atau tinggi, dan sebaliknya.
+            - Kepadatan: Terdapat kepadatan yang lebih tinggi di area penjualan yang lebih rendah (di bawah 400) yang tersebar di berbagai rating. Hal ini menunjukkan bahwa sebagian besar transaksi terjadi dengan total penjualan yang relatif kecil, terlepas dari rating yang diberikan.
+            Secara keseluruhan, gambar ini menunjukkan bahwa tidak ada hubungan yang signifikan atau pola yang jelas antara rating yang diberikan oleh pelanggan dan total penjualan. Hal ini bisa menunjukkan bahwa faktor-faktor lain selain rating mungkin lebih mempengaruhi jumlah total penjualan.
+             """)
+    
+    # Kesimpulan
+    st.title('Kesimpulan')
+    st.markdown("""
+            1. Analisis Penjualan Berdasarkan Cabang dan Kota:
+            Distribusi Penjualan:
+            Distribusi penjualan relatif merata di antara cabang-cabang yang berbeda (A, B, C) dan kota-kota yang terlibat (Yangon, Naypyitaw, Mandalay).
+            Tidak ada perbedaan signifikan dalam total penjualan antara cabang yang satu dengan yang lainnya. Ketiga cabang memiliki performa penjualan yang hampir setara.
+            - Kesimpulan:
+            Cabang-cabang di berbagai kota memiliki kinerja yang hampir seragam, menunjukkan bahwa tidak ada satu cabang atau kota yang mendominasi dalam hal penjualan.
+
+            2. Analisis Tipe Pelanggan:
+            Distribusi Penjualan Berdasarkan Tipe Pelanggan:
+            Penjualan dari pelanggan tipe "Member" dan "Normal" hampir sama besar, tanpa ada perbedaan signifikan antara keduanya.
+            Kedua tipe pelanggan berkontribusi hampir setara terhadap total penjualan.
+            - Kesimpulan:
+            Tidak ada perbedaan yang mencolok antara pelanggan baru dan pelanggan loyal dalam hal kontribusi terhadap penjualan. Kedua tipe pelanggan memiliki potensi yang sama dalam menghasilkan pendapatan.
+
+            3. Analisis Gender:
+            Distribusi Penjualan Berdasarkan Gender:
+            Tidak ada perbedaan signifikan dalam total penjualan antara pelanggan pria dan wanita.
+            Pola pembelian antara pria dan wanita hampir sama, dengan distribusi penjualan yang relatif merata.
+            - Kesimpulan:
+            Gender tidak mempengaruhi pola pembelian secara signifikan, dengan kontribusi yang hampir setara dari pelanggan pria dan wanita.
+
+            4. Analisis Garis Produk (Product Line):
+            Kinerja Garis Produk:
+            Garis produk "Health and Beauty" dan "Electronic Accessories" merupakan yang paling laris.
+            Dalam hal unit price, quantity, dan total penjualan, tidak ada satu garis produk yang secara signifikan lebih unggul di semua kategori. Namun, garis produk tertentu cenderung lebih unggul dalam kategori tertentu.
+            - Kesimpulan:
+            "Health and Beauty" dan "Electronic Accessories" adalah garis produk yang paling menguntungkan. Setiap garis produk memiliki kekuatan dan kelemahan masing-masing dalam hal harga, kuantitas, dan penjualan.
+
+            5. Analisis Metode Pembayaran:
+            Preferensi Metode Pembayaran:
+            Metode pembayaran "E-wallet" sedikit lebih populer daripada "Cash" dan "Credit Card", meskipun perbedaannya tidak terlalu signifikan.
+            Tidak ada bukti yang jelas bahwa metode pembayaran tertentu lebih sering digunakan untuk pembelian dalam jumlah besar.
+            - Kesimpulan:
+            "E-wallet" sedikit lebih disukai oleh pelanggan, tetapi semua metode pembayaran digunakan secara hampir merata.
+
+            6. Analisis Waktu Penjualan:
+            Distribusi Penjualan Berdasarkan Waktu:
+            Tren penjualan menunjukkan fluktuasi yang cukup tajam, dengan beberapa puncak penjualan yang tersebar sepanjang bulan.
+            Waktu puncak penjualan cenderung terjadi pada hari-hari tertentu tanpa pola yang jelas berdasarkan jam atau tanggal.
+            - Kesimpulan:
+            Penjualan bervariasi sepanjang hari dan bulan, tanpa adanya waktu puncak yang konsisten.
+
+            7. Analisis Harga Satuan dan Jumlah Pembelian:
+            Hubungan Unit Price dan Quantity:
+            Tidak ada hubungan yang jelas antara unit price dan quantity, menunjukkan bahwa produk dengan harga lebih tinggi tidak selalu dibeli dalam jumlah lebih kecil, dan sebaliknya.
+            - Kesimpulan:
+            Harga produk tidak secara signifikan mempengaruhi jumlah pembelian, dengan berbagai produk dijual dalam berbagai kuantitas terlepas dari harga satuannya.
+
+            8. Analisis Pendapatan Kotor dan Margin Laba:
+            Hubungan Gross Income, Gross Margin, dan Total Penjualan:
+            Gross income menunjukkan variasi yang besar, tetapi margin laba tetap relatif konsisten di berbagai produk dan tipe pelanggan.
+            Produk atau tipe pelanggan tertentu tidak menunjukkan margin laba yang lebih tinggi secara signifikan.
+            - Kesimpulan:
+            Margin laba cukup konsisten di seluruh produk dan tipe pelanggan, yang menunjukkan bahwa tidak ada strategi penetapan harga yang khusus untuk meningkatkan margin pada segmen tertentu.
+
+            9. Analisis Rating Pelanggan:
+            Hubungan Rating dan Total Penjualan:
+            Tidak ada hubungan yang signifikan antara rating yang diberikan oleh pelanggan dan total penjualan. Penjualan tinggi dapat terjadi pada rating rendah atau tinggi, dan sebaliknya.
+            - Kesimpulan:
+            Rating pelanggan tidak secara signifikan mempengaruhi total penjualan, sehingga faktor lain mungkin lebih penting dalam mendorong penjualan.
+
+            Kesimpulan Umum:
+            Dari analisis di atas, terlihat bahwa distribusi penjualan relatif merata di berbagai dimensi, seperti cabang, kota, tipe pelanggan, gender, metode pembayaran, dan garis produk. Tidak ada faktor tunggal yang dominan dalam mempengaruhi total penjualan, yang menunjukkan bahwa banyak faktor kecil yang berkontribusi secara bersama-sama.
+            Pola waktu penjualan menunjukkan fluktuasi yang besar, tetapi tanpa pola puncak yang jelas, yang menyiratkan bahwa faktor eksternal atau musiman mungkin mempengaruhi penjualan.
+                """)
+    
+    #Recomendation Action
+    st.title('Rekomendation Action')
+    st.markdown("""
+            1. Optimasi Penawaran Produk: Fokus pada produk-produk dalam kategori "Health and Beauty" dan "Electronic Accessories" yang menunjukkan kinerja kuat. Pertimbangkan untuk memperkenalkan promosi silang atau bundling dalam kategori ini.
+
+            2. Penargetan Pelanggan: Meskipun tidak ada perbedaan signifikan antara tipe pelanggan, program loyalitas yang ditingkatkan dapat membantu mempertahankan pelanggan "Member" dan mendorong lebih banyak pembelian berulang.
+
+            3. Diversifikasi Metode Pembayaran: Meskipun "E-wallet" sedikit lebih populer, penting untuk tetap menawarkan berbagai metode pembayaran untuk memenuhi preferensi pelanggan yang beragam.
+
+            4. Strategi Penjualan Berdasarkan Waktu: Mengidentifikasi faktor-faktor eksternal yang mungkin mempengaruhi fluktuasi penjualan dapat membantu dalam merencanakan kampanye pemasaran dan promosi yang lebih efektif pada waktu-waktu tertentu.
+
+            5. Peningkatan Kualitas Layanan: Meskipun rating tidak secara langsung mempengaruhi penjualan, menjaga atau meningkatkan kualitas layanan tetap penting untuk mempertahankan kepuasan pelanggan dan mencegah churn.
+                """)
+
+    
+    #Feature Enginerring
+    st.header("Feature Engineering")
+    st.write("""
+             Sekarang akan dilakukan proses pembuatan model machine learning untuk memprediksi total penjualan selama beberapa minggu kedepan
+             """)
+    st.code("""
+        #Menambahkan fitur 'Month' dan 'Day' dari kolom 'Date'
+
+        data['Month'] = data['Date'].dt.month
+        data['Day'] = data['Date'].dt.day
+
+        #Menambahkan fitur 'Weekday' untuk melihat hari dalam seminggu
+
+        data['Weekday'] = data['Date'].dt.weekday
+
+        #Membuat fitur agregasi penjualan berdasarkan 'Date' (agregasi per hari)
+
+        daily_sales = data.groupby('Date').agg({
+        'Total': 'sum',   # Total penjualan harian
+        'Quantity': 'sum' # Total jumlah barang terjual harian
+        }).reset_index()
+            """, language='python')
+    
+    #Feature Preprocessing
+    st.header("Feature Preprocessing")
+    st.code("""
+        # Mengisi missing values (jika ada)
+        data = data.ffill()
+
+        # Mengubah tipe data kategorikal menjadi numerikal (one-hot encoding)
+        data = pd.get_dummies(data, columns=['Branch', 'City', 'Customer type', 'Gender', 'Product line', 'Payment'])
+
+        # Membuat kolom target 'Sales' dari 'Total' untuk time series forecasting
+        data.set_index('Date', inplace=True)
+
+        # Menyimpan data yang telah dipreprocessing untuk model ARIMA
+        preprocessed_data = daily_sales[['Date', 'Total']].copy()
+        preprocessed_data.set_index('Date', inplace=True)
+
+        preprocessed_data.head()
+
+        weekly_data = preprocessed_data['Total'].resample('W').sum()
+
+        data = weekly_data.copy()
+            """)
+    
+    #Membangun Model
+    st.header("Pembangunan Model")
+    st.write("""
+        Pada tahap ini, dua algoritma machine learning digunakan untuk meramalkan total penjulan mingguan yang akan datang, algoritma yang dipilih adalah ARIMA dan Linear Regression.
+        Pemilihan ARIMA dan Linear Regression sebagai model untuk sales forecasting didasarkan pada karakteristik dan kemampuan kedua model dalam menangani data time series dan hubungan linear antara variabel-variabel.
+
+        1. ARIMA (AutoRegressive Integrated Moving Average):
+        Keunggulan: ARIMA dirancang khusus untuk data time series dan sangat efektif dalam menangani tren, musiman, dan autokorelasi dalam data historis. ARIMA menggabungkan tiga komponen utama: AutoRegressive (AR), Integrated (I), dan Moving Average (MA), yang membuatnya mampu menangkap pola dalam data time series, termasuk tren jangka panjang dan pola musiman.
+        Alasan Pemilihan: ARIMA cocok digunakan untuk forecasting penjualan yang dipengaruhi oleh tren historis, fluktuasi musiman, atau pola lain yang mungkin ada dalam data time series. ARIMA efektif ketika data stasioner atau bisa dibuat stasioner dengan diferensiasi.
+
+        2. Linear Regression:
+        Keunggulan: Linear Regression adalah model yang sederhana dan mudah diinterpretasi, yang mengasumsikan adanya hubungan linear antara variabel independen (misalnya, faktor-faktor yang mempengaruhi penjualan) dan variabel dependen (penjualan). Ini dapat digunakan untuk memprediksi nilai masa depan berdasarkan hubungan historis antara variabel-variabel tersebut.
+        Alasan Pemilihan: Linear Regression cocok digunakan ketika kita memiliki variabel-variabel independen tambahan yang mungkin mempengaruhi penjualan, seperti promosi, harga, atau faktor ekonomi lainnya. Model ini baik untuk menangkap pola linier yang mungkin ada di data.
+        Kombinasi kedua model ini memberikan fleksibilitas, di mana ARIMA menangani pola time series yang kompleks, sementara Linear Regression dapat mengakomodasi hubungan antara variabel independen dan penjualan.
+             """)
+    st.subheader("ARIMA")
+    st.code("""
+        from statsmodels.tsa.arima.model import ARIMA
+        from sklearn.metrics import mean_squared_error
+
+        # Memisahkan data menjadi train dan test set (90% train dan 10% test)
+        train_size = int(len(weekly_data) * 0.9)
+        train, test = weekly_data[:train_size], weekly_data[train_size:]
+
+        # Membuat dan melatih model ARIMA untuk prediksi mingguan
+        model = ARIMA(train, order=(5, 1, 0))
+        model_fit = model.fit()
+
+        # Menampilkan ringkasan dari model
+        print(model_fit.summary())
+
+        # Melakukan prediksi pada train set untuk melihat performa model
+        train_pred = model_fit.predict(start=0, end=len(train)-1, typ='levels')
+
+        # Melakukan prediksi pada test set
+        test_pred = model_fit.predict(start=len(train), end=len(weekly_data)-1, typ='levels')
+
+        # Menghitung RMSE untuk mengukur performa prediksi
+        rmse = np.sqrt(mean_squared_error(test, test_pred))
+        print(f'Test RMSE: {rmse}')
+
+        mae = mean_absolute_error(test, test_pred)
+        mse = mean_squared_error(test, test_pred)
+        rmse = np.sqrt(mse)
+
+        print("Mean Absolute Error (MAE):", mae)
+        print("Mean Squared Error (MSE):", mse)
+        print("Root Mean Squared Error (RMSE):", rmse)
+            """, language='python')
+    st.subheader("Linear Regression")
+    st.code("""
+        from sklearn.model_selection import train_test_split
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+        # Memisahkan data menjadi train dan test set (90% train dan 10% test)
+        train_size = int(len(weekly_data) * 0.9)
+        train, test = weekly_data[:train_size], weekly_data[train_size:]
+
+        X_train = np.arange(len(train)).reshape(-1, 1)
+        y_train = train.values
+
+        X_test = np.arange(len(test)).reshape(-1, 1)
+        y_test = test.values
+
+        # Membuat dan melatih model Linear Regression
+        lr_model = LinearRegression()
+        lr_model.fit(X_train, y_train)
+
+        # Melakukan prediksi pada test set
+        y_pred = lr_model.predict(X_test)
+
+        # Evaluasi model
+        mae = mean_absolute_error(y_test, y_pred)
+        mse = mean_squared_error(y_test, y_pred)
+        rmse = np.sqrt(mse)
+
+        print("Mean Absolute Error (MAE):", mae)
+        print("Mean Squared Error (MSE):", mse)
+        print("Root Mean Squared Error (RMSE):", rmse)
+            """, language='python')
+    
+    #Hasil Evaluasi untuk Logistic Regression
+    st.header("Evaluation Model")
+    # Metrik dari backtest rolling-origin (python backtest.py), bukan angka statis;
+    # dicari berdasarkan hash seri mingguan data yang sedang ditampilkan
+    backtest_metrics, backtest_info = load_metrics(get_period_sales(store.daily, store.version, 'W'))
+    st.write("""
+        Berikut adalah hasil metrik evaluasi semua kandidat model dengan rolling-origin backtest:
+        model dilatih pada minggu-minggu awal lalu diuji pada minggu berikutnya, dan titik awal uji digeser satu minggu setiap fold.
+             """)
+    st.dataframe(backtest_metrics, hide_index=True)
+    modified = pd.Timestamp(backtest_info['modified'], unit='s').strftime('%Y-%m-%d %H:%M')
+    if backtest_info['fresh']:
+        st.caption(f"Backtest untuk data {backtest_info['data_hash'][:12]}, dihitung {modified}.")
+    else:
+        st.warning(f"Belum ada backtest untuk data saat ini ({backtest_info['data_hash'][:12]}); metrik di atas "
+                   f"dari {backtest_info['path']} ({modified}) dan bisa berasal dari data lain. "
+                   f"Jalankan `python backtest.py` untuk memperbarui.")
+    best_model = backtest_metrics.iloc[0]
+    st.write(f"Kesimpulan: {best_model['Model']} ({best_model['Params'] or 'default'}) memiliki nilai RMSE terendah "
+             f"({best_model['RMSE']:.2f}).")
+    
+    st.header("Hyperparamter Tunning")
+    st.write("""
+    Sekarang akan dilakukan hyperparameter tuning untuk meningkatkan performa model pada Linear Regression:
+    """)
+    st.code("""
+        from backtest import run_backtest
+
+        # Grid kandidat: LinearRegression, Ridge dengan beberapa alpha, dan ARIMA(5,1,0)
+        CANDIDATES = {
+        'LinearRegression': {},
+        'Ridge': {'alpha': [0.1, 1.0, 10.0, 100.0]},
+        'ARIMA': {'order': [(5, 1, 0)]},
+        }
+
+        # Rolling-origin split (bukan 5-fold CV yang diacak): minimal 8 minggu untuk train,
+        # 1 minggu untuk test per fold. Fold dijalankan paralel di semua core dan di-cache di disk.
+        # Ringkasan juga disimpan di .cache/backtest/<hash data>/metrics.csv
+        metrics = run_backtest(weekly_data, min_train=8, horizon=1, candidates=CANDIDATES)
+            """, language='python')
+    st.dataframe(backtest_metrics[backtest_metrics['Model'].isin(['LinearRegression', 'Ridge'])], hide_index=True)
+    st.write("""
+             setelah dilakukan hyperparameter tuning, model menunjukan peningkatan dengan ditandai menurunnya nilai MAE, MSE, dan RMSE, sehingga
+             Model Linear Regression dakan dipilih untuk melakukan sales forecasting.
+             """)